@@ -11,6 +11,8 @@ import org.springframework.http.HttpHeaders;
 import org.springframework.http.MediaType;
 import org.springframework.http.ResponseEntity;
 import org.springframework.stereotype.Service;
+import org.springframework.transaction.support.TransactionSynchronization;
+import org.springframework.transaction.support.TransactionSynchronizationManager;
 import org.springframework.web.client.HttpClientErrorException;
 import org.springframework.web.client.HttpServerErrorException;
 import org.springframework.web.client.ResourceAccessException;
@@ -229,6 +231,40 @@ public class AIServiceClient {
         return post("/api/ai/sentiment-analysis", request, SentimentAnalysisResponse.class);
     }
 
+    // ========================================================================
+    // 사용자 컨텍스트 캐시 무효화
+    // ========================================================================
+
+    /**
+     * AI 서버의 사용자 컨텍스트 캐시 무효화 (프로필/선호도 수정 후)
+     * - 트랜잭션 안이면 커밋 후 호출 (커밋 전에 재조회되어 옛 값이 다시 캐시되는 것 방지)
+     * - 실패해도 AI 서버 캐시 TTL(60초) 후 자연 만료되므로 예외를 던지지 않음
+     */
+    public void invalidateUserContextAfterCommit(Long userId) {
+        if (userId == null) {
+            return;
+        }
+        if (TransactionSynchronizationManager.isSynchronizationActive()) {
+            TransactionSynchronizationManager.registerSynchronization(new TransactionSynchronization() {
+                @Override
+                public void afterCommit() {
+                    invalidateUserContext(userId);
+                }
+            });
+        } else {
+            invalidateUserContext(userId);
+        }
+    }
+
+    private void invalidateUserContext(Long userId) {
+        try {
+            restTemplate.delete(config.getUrl() + "/api/ai/recommendations/users/{userId}/context", userId);
+            log.info("🧹 AI 사용자 컨텍스트 캐시 무효화: userId={}", userId);
+        } catch (Exception e) {
+            log.warn("⚠️ AI 사용자 컨텍스트 캐시 무효화 실패 (TTL 만료 대기): userId={}, {}", userId, e.getMessage());
+        }
+    }
+
     // ========================================================================
     // 헬스체크 & 모델 정보
     // ========================================================================
@@ -5,6 +5,7 @@ import com.project.itda.domain.badge.entity.Badge;
 import com.project.itda.domain.notification.entity.Notification;
 import com.project.itda.domain.notification.enums.NotificationType;
 import com.project.itda.domain.notification.repository.NotificationRepository;
+import com.project.itda.domain.notification.service.NotificationCacheService;
 import com.project.itda.domain.user.entity.User;
 import com.project.itda.domain.user.repository.UserRepository;
 import lombok.RequiredArgsConstructor;
@@ -30,6 +31,7 @@ public class BadgeWebSocketNotificationAdapter implements BadgeNotificationPort
     private final SimpMessagingTemplate messagingTemplate;
     private final NotificationRepository notificationRepository;
     private final UserRepository userRepository;
+    private final NotificationCacheService notificationCacheService;
 
     @Override
     public void sendBadgeUnlocked(Long userId, Badge badge) {
@@ -50,6 +52,8 @@ public class BadgeWebSocketNotificationAdapter implements BadgeNotificationPort
                     .build();
 
             Notification saved = notificationRepository.save(notification);
+            notificationCacheService.evictUnreadCount(userId);
+            notificationCacheService.evictList(userId);
             log.info("✅ 배지 알림 DB 저장 완료. userId={}, badgeCode={}", userId, badge.getBadgeCode());
 
             // 3. WebSocket으로 실시간 알림 전송 (배지 전용 채널)
@@ -25,6 +25,7 @@ public class AISearchRequest {
     private Integer maxCost;  // 최대 비용
     private String vibe;  // "활기찬", "여유로운" 등
     private List<String> keywords;  // 키워드 리스트
+    private Integer size;  // 최대 반환 개수 (null이면 기본 100, 초과 시 가까운 순으로 자름)
 
     @Getter
     @Setter
@@ -27,6 +27,7 @@ public class AISearchService {
 
     private static final int MIN_CANDIDATES = 30;
     private static final int MIN_CATEGORY_CANDIDATES = 5;
+    private static final int DEFAULT_SIZE = 100;
 
     public AISearchResponse searchForAI(AISearchRequest request) {
         log.info("🤖 AI 검색: category={}, subcategory={}, timeSlot={}, locationQuery={}, locationType={}, vibe={}, maxCost={}, keywords={}",
@@ -192,6 +193,12 @@ public class AISearchService {
         // 9) 거리 계산 + nearMe일 때만 radius 적용/정렬
         meetings = applyDistanceLogic(meetings, request);
 
+        // 10) size 상한 (AI 서버가 스코어링할 후보만 DTO 변환/전송)
+        //     - 거리순으로 자르므로 사용자 위치가 없으면 적용하지 않음 (임의의 100개만 남는 것 방지)
+        if (hasUserLocation(request)) {
+            meetings = applySizeLimit(meetings, request.getSize() != null ? request.getSize() : DEFAULT_SIZE);
+        }
+
         // DTO 변환
         List<AIMeetingDTO> meetingDTOs = meetings.stream()
                 .map(this::convertToDTO)
@@ -279,14 +286,30 @@ public class AISearchService {
         return filtered;
     }
 
+    private boolean hasUserLocation(AISearchRequest request) {
+        return request.getUserLocation() != null
+                && request.getUserLocation().getLatitude() != null
+                && request.getUserLocation().getLongitude() != null;
+    }
+
+    private List<Meeting> applySizeLimit(List<Meeting> meetings, Integer size) {
+        if (meetings == null || size == null || size <= 0 || meetings.size() <= size) return meetings;
+
+        log.info("✂️ [size={}] 후보 상한 적용: {} -> {}", size, meetings.size(), size);
+
+        return meetings.stream()
+                .sorted(Comparator.comparing(Meeting::getDistanceKm, Comparator.nullsLast(Comparator.naturalOrder())))
+                .limit(size)
+                .toList();
+    }
+
     // =========================
     // 거리 로직
     // =========================
 
     private List<Meeting> applyDistanceLogic(List<Meeting> meetings, AISearchRequest request) {
         if (meetings == null || meetings.isEmpty()) return meetings;
-        if (request.getUserLocation() == null) return meetings;
-        if (request.getUserLocation().getLatitude() == null || request.getUserLocation().getLongitude() == null) return meetings;
+        if (!hasUserLocation(request)) return meetings;
 
         Double userLat = request.getUserLocation().getLatitude();
         Double userLng = request.getUserLocation().getLongitude();
@@ -1,13 +1,14 @@
 package com.project.itda.domain.notification.controller;
 
+import com.project.itda.domain.notification.dto.request.NotificationBatchRequest;
 import com.project.itda.domain.notification.dto.response.NotificationListResponse;
 import com.project.itda.domain.notification.dto.response.NotificationResponse;
 import com.project.itda.domain.notification.entity.Notification;
 import com.project.itda.domain.notification.enums.NotificationType;
-import com.project.itda.domain.notification.repository.NotificationRepository;
 import com.project.itda.domain.notification.service.NotificationService;
 import com.project.itda.domain.user.entity.User;
 import com.project.itda.domain.user.repository.UserRepository;
+import jakarta.validation.Valid;
 import lombok.RequiredArgsConstructor;
 import lombok.extern.slf4j.Slf4j;
 import org.springframework.http.ResponseEntity;
@@ -26,20 +27,23 @@ import java.util.Map;
 public class NotificationController {
 
     private final NotificationService notificationService;
-    private final NotificationRepository notificationRepository;
     private final UserRepository userRepository;
 
     /**
      * ✅ 알림 목록 조회 (페이징)
+     * - cursor가 있으면 커서 기반 조회 (page는 하위 호환용, deprecated)
      */
     @GetMapping
     public ResponseEntity<NotificationListResponse> getNotifications(
             @RequestParam Long userId,
             @RequestParam(defaultValue = "0") int page,
-            @RequestParam(defaultValue = "20") int size
+            @RequestParam(defaultValue = "20") int size,
+            @RequestParam(required = false) String cursor
     ) {
-        log.info("📋 알림 목록 조회: userId={}, page={}, size={}", userId, page, size);
-        NotificationListResponse response = notificationService.getNotifications(userId, page, size);
+        log.info("📋 알림 목록 조회: userId={}, page={}, size={}, cursor={}", userId, page, size, cursor);
+        NotificationListResponse response = (cursor != null && !cursor.isBlank())
+                ? notificationService.getNotificationsByCursor(userId, cursor, size)
+                : notificationService.getNotifications(userId, page, size);
         return ResponseEntity.ok(response);
     }
 
@@ -83,16 +87,42 @@ public class NotificationController {
         return ResponseEntity.ok().build();
     }
 
+    /**
+     * ✅ 여러 알림 일괄 읽음 처리
+     */
+    @PatchMapping("/read")
+    public ResponseEntity<Map<String, Integer>> markAsReadBatch(
+            @RequestParam Long userId,
+            @Valid @RequestBody NotificationBatchRequest request
+    ) {
+        log.info("✅ 알림 일괄 읽음 처리: userId={}, count={}", userId, request.getNotificationIds().size());
+        int updated = notificationService.markAsRead(userId, request.getNotificationIds());
+        return ResponseEntity.ok(Map.of("updatedCount", updated));
+    }
+
     /**
      * ✅ 단일 알림 삭제
      */
     @DeleteMapping("/{id}")
-    public ResponseEntity<Void> deleteNotification(@PathVariable Long id) {
-        log.info("🗑️ 알림 삭제: id={}", id);
-        notificationService.deleteNotification(id);
+    public ResponseEntity<Void> deleteNotification(@PathVariable Long id, @RequestParam Long userId) {
+        log.info("🗑️ 알림 삭제: id={}, userId={}", id, userId);
+        notificationService.deleteNotification(userId, id);
         return ResponseEntity.ok().build();
     }
 
+    /**
+     * ✅ 여러 알림 일괄 삭제
+     */
+    @PostMapping("/delete")
+    public ResponseEntity<Map<String, Integer>> deleteNotificationsBatch(
+            @RequestParam Long userId,
+            @Valid @RequestBody NotificationBatchRequest request
+    ) {
+        log.info("🗑️ 알림 일괄 삭제: userId={}, count={}", userId, request.getNotificationIds().size());
+        int deleted = notificationService.deleteNotifications(userId, request.getNotificationIds());
+        return ResponseEntity.ok(Map.of("deletedCount", deleted));
+    }
+
     /**
      * ✅ 전체 알림 삭제
      */
@@ -136,19 +166,18 @@ public class NotificationController {
         String senderName = (String) body.getOrDefault("senderName", null);
         String senderProfileImage = (String) body.getOrDefault("senderProfileImage", null);
 
-        Notification notification = Notification.builder()
-                .user(user)
-                .notificationType(NotificationType.valueOf(type))
-                .title(title)
-                .content(content)
-                .linkUrl(linkUrl)
-                .relatedId(relatedId)
-                .senderId(senderId)
-                .senderName(senderName)
-                .senderProfileImage(senderProfileImage)
-                .build();
-
-        notification = notificationRepository.save(notification);
+        // 서비스 경유로 저장 → 캐시 무효화/웹소켓 푸시까지 실제 알림과 동일하게 처리
+        Notification notification = notificationService.createNotification(
+                user,
+                NotificationType.valueOf(type),
+                title,
+                content,
+                linkUrl,
+                relatedId,
+                senderId,
+                senderName,
+                senderProfileImage
+        );
 
         log.info("✅ 테스트 알림 생성 완료: id={}", notification.getNotificationId());
 
@@ -177,7 +206,7 @@ public class NotificationController {
                 createNotification(user, NotificationType.SYSTEM, "시스템 알림", "📢 IT-DA 서비스 업데이트 안내입니다.", null, null, null, null, null)
         );
 
-        notificationRepository.saveAll(notifications);
+        notificationService.createNotifications(notifications);
 
         int count = notifications.size();
         log.info("✅ 테스트 알림 일괄 생성 완료: {}개", count);
@@ -0,0 +1,22 @@
+package com.project.itda.domain.notification.dto.request;
+
+import jakarta.validation.constraints.NotEmpty;
+import lombok.AllArgsConstructor;
+import lombok.Builder;
+import lombok.Getter;
+import lombok.NoArgsConstructor;
+
+import java.util.List;
+
+/**
+ * ✅ 알림 일괄 처리 요청 (읽음/삭제)
+ */
+@Getter
+@Builder
+@NoArgsConstructor
+@AllArgsConstructor
+public class NotificationBatchRequest {
+
+    @NotEmpty(message = "알림 ID 목록은 필수입니다")
+    private List<Long> notificationIds;
+}
@@ -16,6 +16,7 @@ public class NotificationListResponse {
     private int page;
     private int size;
     private boolean hasNext;
+    private String nextCursor;  // 다음 페이지 커서 (없으면 null)
 
     public static NotificationListResponse of(
             List<NotificationResponse> notifications,
@@ -23,6 +24,17 @@ public class NotificationListResponse {
             int page,
             int size,
             boolean hasNext
+    ) {
+        return of(notifications, unreadCount, page, size, hasNext, null);
+    }
+
+    public static NotificationListResponse of(
+            List<NotificationResponse> notifications,
+            long unreadCount,
+            int page,
+            int size,
+            boolean hasNext,
+            String nextCursor
     ) {
         return NotificationListResponse.builder()
                 .notifications(notifications)
@@ -31,6 +43,7 @@ public class NotificationListResponse {
                 .page(page)
                 .size(size)
                 .hasNext(hasNext)
+                .nextCursor(nextCursor)
                 .build();
     }
 
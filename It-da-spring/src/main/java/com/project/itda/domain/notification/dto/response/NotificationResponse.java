@@ -29,6 +29,13 @@ public class NotificationResponse {
     private String timeAgo;  // "2분 전", "1시간 전" 등
 
     public static NotificationResponse from(Notification notification) {
+        return from(notification, LocalDateTime.now());
+    }
+
+    /**
+     * 목록 변환용: 기준 시각(now)을 한 번만 구해서 모든 행에 재사용
+     */
+    public static NotificationResponse from(Notification notification, LocalDateTime now) {
         return NotificationResponse.builder()
                 .notificationId(notification.getNotificationId())
                 .userId(notification.getUser().getUserId())
@@ -43,14 +50,20 @@ public class NotificationResponse {
                 .isRead(notification.getIsRead())
                 .sentAt(notification.getSentAt())
                 .readAt(notification.getReadAt())
-                .timeAgo(formatTimeAgo(notification.getSentAt()))
+                .timeAgo(formatTimeAgo(notification.getSentAt(), now))
                 .build();
     }
 
-    private static String formatTimeAgo(LocalDateTime dateTime) {
+    /**
+     * 캐시에서 꺼낸 응답의 timeAgo를 조회 시점 기준으로 다시 계산
+     */
+    public void refreshTimeAgo(LocalDateTime now) {
+        this.timeAgo = formatTimeAgo(this.sentAt, now);
+    }
+
+    private static String formatTimeAgo(LocalDateTime dateTime, LocalDateTime now) {
         if (dateTime == null) return "";
 
-        LocalDateTime now = LocalDateTime.now();
         long minutes = ChronoUnit.MINUTES.between(dateTime, now);
         long hours = ChronoUnit.HOURS.between(dateTime, now);
         long days = ChronoUnit.DAYS.between(dateTime, now);
@@ -10,10 +10,12 @@ import java.time.LocalDateTime;
 
 @Entity
 @Table(name = "notifications", indexes = {
-        @Index(name = "idx_notification_user", columnList = "user_id"),
         @Index(name = "idx_notification_type", columnList = "notification_type"),
-        @Index(name = "idx_notification_is_read", columnList = "is_read"),
-        @Index(name = "idx_notification_sent", columnList = "sent_at")
+        @Index(name = "idx_notification_sent", columnList = "sent_at"),
+        // 전체 목록(최신순) + 커서 페이징: (user_id, sent_at) + PK로 정렬까지 인덱스 순서로 처리
+        @Index(name = "idx_notification_user_sent", columnList = "user_id, sent_at"),
+        // 안읽은 목록(최신순) + 안읽은 개수를 단일 인덱스 range scan으로 처리
+        @Index(name = "idx_notification_user_read_sent", columnList = "user_id, is_read, sent_at")
 })
 @Getter
 @NoArgsConstructor(access = AccessLevel.PROTECTED)
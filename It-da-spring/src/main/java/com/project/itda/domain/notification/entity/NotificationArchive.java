@@ -0,0 +1,67 @@
+package com.project.itda.domain.notification.entity;
+
+import com.project.itda.domain.notification.enums.NotificationType;
+import jakarta.persistence.*;
+import lombok.AccessLevel;
+import lombok.Getter;
+import lombok.NoArgsConstructor;
+
+import java.time.LocalDateTime;
+
+/**
+ * ✅ 보관 알림 (30일 지난 알림)
+ * - notifications에서 INSERT ... SELECT로 옮겨 담기만 하고 애플리케이션에서 생성하지 않음
+ * - 원본 notification_id 그대로 사용, 사용자 삭제와 무관하게 보관되도록 FK 없음
+ */
+@Entity
+@Table(name = "notifications_archive", indexes = {
+        @Index(name = "idx_notification_archive_user_sent", columnList = "user_id, sent_at")
+})
+@Getter
+@NoArgsConstructor(access = AccessLevel.PROTECTED)
+public class NotificationArchive {
+
+    @Id
+    @Column(name = "notification_id")
+    private Long notificationId;
+
+    @Column(name = "user_id", nullable = false)
+    private Long userId;
+
+    @Enumerated(EnumType.STRING)
+    @Column(name = "notification_type", nullable = false, length = 50)
+    private NotificationType notificationType;
+
+    @Column(name = "title", nullable = false, length = 200)
+    private String title;
+
+    @Column(name = "content", nullable = false, columnDefinition = "TEXT")
+    private String content;
+
+    @Column(name = "link_url", length = 500)
+    private String linkUrl;
+
+    @Column(name = "related_id")
+    private Long relatedId;
+
+    @Column(name = "sender_id")
+    private Long senderId;
+
+    @Column(name = "sender_name", length = 50)
+    private String senderName;
+
+    @Column(name = "sender_profile_image", length = 500)
+    private String senderProfileImage;
+
+    @Column(name = "is_read")
+    private Boolean isRead;
+
+    @Column(name = "sent_at", nullable = false)
+    private LocalDateTime sentAt;
+
+    @Column(name = "read_at")
+    private LocalDateTime readAt;
+
+    @Column(name = "archived_at", nullable = false)
+    private LocalDateTime archivedAt;
+}
@@ -0,0 +1,25 @@
+package com.project.itda.domain.notification.repository;
+
+import com.project.itda.domain.notification.entity.NotificationArchive;
+import org.springframework.data.jpa.repository.JpaRepository;
+import org.springframework.data.jpa.repository.Modifying;
+import org.springframework.data.jpa.repository.Query;
+import org.springframework.data.repository.query.Param;
+import org.springframework.stereotype.Repository;
+
+import java.util.List;
+
+@Repository
+public interface NotificationArchiveRepository extends JpaRepository<NotificationArchive, Long> {
+
+    // 알림 보관 (DB 안에서 INSERT ... SELECT, 행을 애플리케이션으로 가져오지 않음)
+    @Modifying
+    @Query(value = "INSERT INTO notifications_archive " +
+            "(notification_id, user_id, notification_type, title, content, link_url, related_id, " +
+            "sender_id, sender_name, sender_profile_image, is_read, sent_at, read_at, archived_at) " +
+            "SELECT notification_id, user_id, notification_type, title, content, link_url, related_id, " +
+            "sender_id, sender_name, sender_profile_image, is_read, sent_at, read_at, NOW() " +
+            "FROM notifications WHERE notification_id IN (:ids)",
+            nativeQuery = true)
+    int archiveByNotificationIds(@Param("ids") List<Long> ids);
+}
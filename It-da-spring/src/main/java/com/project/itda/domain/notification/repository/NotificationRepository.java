@@ -2,8 +2,8 @@ package com.project.itda.domain.notification.repository;
 
 import com.project.itda.domain.notification.entity.Notification;
 import com.project.itda.domain.notification.enums.NotificationType;
-import org.springframework.data.domain.Page;
 import org.springframework.data.domain.Pageable;
+import org.springframework.data.domain.Slice;
 import org.springframework.data.jpa.repository.JpaRepository;
 import org.springframework.data.jpa.repository.Modifying;
 import org.springframework.data.jpa.repository.Query;
@@ -12,15 +12,31 @@ import org.springframework.stereotype.Repository;
 
 import java.time.LocalDateTime;
 import java.util.List;
+import java.util.Optional;
 
 @Repository
 public interface NotificationRepository extends JpaRepository<Notification, Long> {
 
-    // 사용자의 알림 목록 (최신순, 페이징)
-    Page<Notification> findByUser_UserIdOrderBySentAtDesc(Long userId, Pageable pageable);
+    // 사용자의 알림 목록 + 안읽은 개수 (COUNT 쿼리 없는 Slice, 단일 쿼리)
+    @Query("SELECT n, (SELECT COUNT(u) FROM Notification u WHERE u.user.userId = :userId AND u.isRead = false) " +
+            "FROM Notification n WHERE n.user.userId = :userId ORDER BY n.sentAt DESC, n.notificationId DESC")
+    Slice<Object[]> findSliceWithUnreadCount(@Param("userId") Long userId, Pageable pageable);
 
-    // 사용자의 알림 목록 (최신순, 전체)
-    List<Notification> findByUser_UserIdOrderBySentAtDesc(Long userId);
+    // 커서(sentAt, notificationId) 이후 알림 목록 + 안읽은 개수 (keyset 페이징)
+    @Query("SELECT n, (SELECT COUNT(u) FROM Notification u WHERE u.user.userId = :userId AND u.isRead = false) " +
+            "FROM Notification n WHERE n.user.userId = :userId " +
+            "AND (n.sentAt < :sentAt OR (n.sentAt = :sentAt AND n.notificationId < :notificationId)) " +
+            "ORDER BY n.sentAt DESC, n.notificationId DESC")
+    List<Object[]> findAfterCursorWithUnreadCount(
+            @Param("userId") Long userId,
+            @Param("sentAt") LocalDateTime sentAt,
+            @Param("notificationId") Long notificationId,
+            Pageable pageable);
+
+    // 사용자의 알림 목록 (최신순, 전체) + 안읽은 개수 (단일 쿼리)
+    @Query("SELECT n, (SELECT COUNT(u) FROM Notification u WHERE u.user.userId = :userId AND u.isRead = false) " +
+            "FROM Notification n WHERE n.user.userId = :userId ORDER BY n.sentAt DESC")
+    List<Object[]> findAllWithUnreadCount(@Param("userId") Long userId);
 
     // 읽지 않은 알림 목록
     List<Notification> findByUser_UserIdAndIsReadFalseOrderBySentAtDesc(Long userId);
@@ -28,6 +44,10 @@ public interface NotificationRepository extends JpaRepository<Notification, Long
     // 읽지 않은 알림 개수
     long countByUser_UserIdAndIsReadFalse(Long userId);
 
+    // 알림 수신자 ID 조회 (캐시 무효화용, 엔티티 로딩 없음)
+    @Query("SELECT n.user.userId FROM Notification n WHERE n.notificationId = :notificationId")
+    Optional<Long> findUserIdByNotificationId(@Param("notificationId") Long notificationId);
+
     // 특정 타입 알림 조회
     List<Notification> findByUser_UserIdAndNotificationTypeOrderBySentAtDesc(Long userId, NotificationType type);
 
@@ -36,15 +56,38 @@ public interface NotificationRepository extends JpaRepository<Notification, Long
     @Query("UPDATE Notification n SET n.isRead = true, n.readAt = CURRENT_TIMESTAMP WHERE n.user.userId = :userId AND n.isRead = false")
     int markAllAsRead(@Param("userId") Long userId);
 
-    // 특정 알림 읽음 처리
+    // 특정 알림 읽음 처리 (이미 읽은 알림은 갱신하지 않음 → readAt 유지, 반환값 0)
     @Modifying
-    @Query("UPDATE Notification n SET n.isRead = true, n.readAt = CURRENT_TIMESTAMP WHERE n.notificationId = :notificationId")
+    @Query("UPDATE Notification n SET n.isRead = true, n.readAt = CURRENT_TIMESTAMP " +
+            "WHERE n.notificationId = :notificationId AND n.isRead = false")
     int markAsRead(@Param("notificationId") Long notificationId);
 
-    // 오래된 알림 삭제 (30일 이상)
+    // 여러 알림 일괄 읽음 처리 (단일 UPDATE)
+    @Modifying
+    @Query("UPDATE Notification n SET n.isRead = true, n.readAt = CURRENT_TIMESTAMP " +
+            "WHERE n.user.userId = :userId AND n.notificationId IN :ids AND n.isRead = false")
+    int markAsReadByIds(@Param("userId") Long userId, @Param("ids") List<Long> ids);
+
+    // 단일 알림 삭제 (deleteById의 엔티티 SELECT + remove 대신 단일 DELETE, 수신자 본인 것만)
+    @Modifying
+    @Query("DELETE FROM Notification n WHERE n.notificationId = :notificationId AND n.user.userId = :userId")
+    int deleteByNotificationIdAndUserId(@Param("notificationId") Long notificationId, @Param("userId") Long userId);
+
+    // 여러 알림 일괄 삭제 (단일 DELETE)
+    @Modifying
+    @Query("DELETE FROM Notification n WHERE n.user.userId = :userId AND n.notificationId IN :ids")
+    int deleteByIds(@Param("userId") Long userId, @Param("ids") List<Long> ids);
+
+    // 보관 대상 오래된 알림 ID (배치 단위, 보관/삭제가 끝날 때까지 행 잠금)
+    @Query(value = "SELECT notification_id FROM notifications WHERE sent_at < :date " +
+            "ORDER BY sent_at, notification_id LIMIT :limit FOR UPDATE",
+            nativeQuery = true)
+    List<Long> findOldNotificationIdsForUpdate(@Param("date") LocalDateTime date, @Param("limit") int limit);
+
+    // 보관 완료된 알림 삭제 (ID 지정, 단일 DELETE)
     @Modifying
-    @Query("DELETE FROM Notification n WHERE n.sentAt < :date")
-    int deleteOldNotifications(@Param("date") LocalDateTime date);
+    @Query("DELETE FROM Notification n WHERE n.notificationId IN :ids")
+    int deleteByNotificationIds(@Param("ids") List<Long> ids);
 
     // 사용자의 모든 알림 삭제
     @Modifying
@@ -11,18 +11,20 @@ import lombok.RequiredArgsConstructor;
 import lombok.extern.slf4j.Slf4j;
 import org.springframework.scheduling.annotation.Scheduled;
 import org.springframework.stereotype.Component;
-import org.springframework.transaction.annotation.Transactional;
 
 import java.time.LocalDate;
 import java.time.LocalDateTime;
 import java.time.LocalTime;
+import java.util.ArrayList;
 import java.util.List;
+import java.util.stream.Collectors;
 
 /**
  * ✅ 알림 스케줄러
  * - 모임 리마인더 (D-1, D-day)
  * - 후기 요청 (모임 종료 후)
- * - 오래된 알림 삭제
+ * - 오래된 알림 보관(notifications_archive) 후 삭제
+ * - 발송은 모임 단위 트랜잭션 + saveAll (한 모임 실패가 다른 모임 발송을 롤백하지 않음)
  */
 @Slf4j
 @Component
@@ -37,7 +39,6 @@ public class NotificationScheduler {
      * ✅ 매일 오전 9시에 D-1 리마인더 발송
      */
     @Scheduled(cron = "0 0 9 * * *")
-    @Transactional(readOnly = true)
     public void sendDayBeforeReminders() {
         log.info("🔔 D-1 리마인더 스케줄러 시작");
 
@@ -49,28 +50,16 @@ public class NotificationScheduler {
 
         int sentCount = 0;
         for (Meeting meeting : tomorrowMeetings) {
-            List<Participation> participants = participationRepository.findByMeetingIdAndStatus(
-                    meeting.getMeetingId(), ParticipationStatus.APPROVED);
-
-            for (Participation p : participants) {
-                notificationService.notifyMeetingReminder(
-                        p.getUser(),
-                        meeting.getMeetingId(),
-                        meeting.getTitle(),
-                        "D-1"
-                );
-                sentCount++;
-            }
-
-            User organizer = meeting.getOrganizer();
-            if (organizer != null) {
-                notificationService.notifyMeetingReminder(
-                        organizer,
+            try {
+                sentCount += notificationService.notifyMeetingReminders(
+                        reminderReceivers(meeting),
                         meeting.getMeetingId(),
                         meeting.getTitle(),
                         "D-1"
                 );
-                sentCount++;
+            } catch (Exception e) {
+                // 모임 단위로 커밋되므로 실패한 모임만 건너뛰고 계속 진행
+                log.error("❌ D-1 리마인더 전송 실패: meetingId={}, {}", meeting.getMeetingId(), e.getMessage());
             }
         }
 
@@ -81,7 +70,6 @@ public class NotificationScheduler {
      * ✅ 매일 오전 8시에 D-day 리마인더 발송
      */
     @Scheduled(cron = "0 0 8 * * *")
-    @Transactional(readOnly = true)
     public void sendDayOfReminders() {
         log.info("🔔 D-day 리마인더 스케줄러 시작");
 
@@ -93,28 +81,16 @@ public class NotificationScheduler {
 
         int sentCount = 0;
         for (Meeting meeting : todayMeetings) {
-            List<Participation> participants = participationRepository.findByMeetingIdAndStatus(
-                    meeting.getMeetingId(), ParticipationStatus.APPROVED);
-
-            for (Participation p : participants) {
-                notificationService.notifyMeetingReminder(
-                        p.getUser(),
-                        meeting.getMeetingId(),
-                        meeting.getTitle(),
-                        "D-day"
-                );
-                sentCount++;
-            }
-
-            User organizer = meeting.getOrganizer();
-            if (organizer != null) {
-                notificationService.notifyMeetingReminder(
-                        organizer,
+            try {
+                sentCount += notificationService.notifyMeetingReminders(
+                        reminderReceivers(meeting),
                         meeting.getMeetingId(),
                         meeting.getTitle(),
                         "D-day"
                 );
-                sentCount++;
+            } catch (Exception e) {
+                // 모임 단위로 커밋되므로 실패한 모임만 건너뛰고 계속 진행
+                log.error("❌ D-day 리마인더 전송 실패: meetingId={}, {}", meeting.getMeetingId(), e.getMessage());
             }
         }
 
@@ -125,7 +101,6 @@ public class NotificationScheduler {
      * ✅ 매일 오후 9시에 후기 요청 발송
      */
     @Scheduled(cron = "0 0 21 * * *")
-    @Transactional(readOnly = true)
     public void sendReviewRequests() {
         log.info("🔔 후기 요청 스케줄러 시작");
 
@@ -138,16 +113,19 @@ public class NotificationScheduler {
         int sentCount = 0;
         for (Meeting meeting : endedMeetings) {
             if (meeting.getMeetingTime().isBefore(LocalDateTime.now())) {
-                List<Participation> participants = participationRepository.findByMeetingIdAndStatus(
-                        meeting.getMeetingId(), ParticipationStatus.APPROVED);
-
-                for (Participation p : participants) {
-                    notificationService.notifyReviewRequest(
-                            p.getUser(),
+                List<User> participants = participationRepository.findByMeetingIdAndStatus(
+                                meeting.getMeetingId(), ParticipationStatus.APPROVED).stream()
+                        .map(Participation::getUser)
+                        .collect(Collectors.toList());
+
+                try {
+                    sentCount += notificationService.notifyReviewRequests(
+                            participants,
                             meeting.getMeetingId(),
                             meeting.getTitle()
                     );
-                    sentCount++;
+                } catch (Exception e) {
+                    log.error("❌ 후기 요청 전송 실패: meetingId={}, {}", meeting.getMeetingId(), e.getMessage());
                 }
             }
         }
@@ -156,10 +134,25 @@ public class NotificationScheduler {
     }
 
     /**
-     * ✅ 매일 새벽 3시에 오래된 알림 삭제 (30일 이상)
+     * 리마인더 수신자: 승인된 참가자 + 주최자
+     */
+    private List<User> reminderReceivers(Meeting meeting) {
+        List<User> receivers = participationRepository.findByMeetingIdAndStatus(
+                        meeting.getMeetingId(), ParticipationStatus.APPROVED).stream()
+                .map(Participation::getUser)
+                .collect(Collectors.toCollection(ArrayList::new));
+
+        User organizer = meeting.getOrganizer();
+        if (organizer != null) {
+            receivers.add(organizer);
+        }
+        return receivers;
+    }
+
+    /**
+     * ✅ 매일 새벽 3시에 오래된 알림 보관 후 삭제 (30일 이상)
      */
     @Scheduled(cron = "0 0 3 * * *")
-    @Transactional
     public void cleanupOldNotifications() {
         log.info("🧹 오래된 알림 삭제 스케줄러 시작");
 
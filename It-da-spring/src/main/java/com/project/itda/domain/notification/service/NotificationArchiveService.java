@@ -0,0 +1,44 @@
+package com.project.itda.domain.notification.service;
+
+import com.project.itda.domain.notification.repository.NotificationArchiveRepository;
+import com.project.itda.domain.notification.repository.NotificationRepository;
+import lombok.RequiredArgsConstructor;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Transactional;
+
+import java.time.LocalDateTime;
+import java.util.List;
+
+/**
+ * ✅ 오래된 알림 보관 처리
+ * - 배치 하나 = 트랜잭션 하나 (ID 잠금 + 보관 INSERT ... SELECT + 원본 DELETE)
+ */
+@Service
+@RequiredArgsConstructor
+public class NotificationArchiveService {
+
+    private final NotificationRepository notificationRepository;
+    private final NotificationArchiveRepository notificationArchiveRepository;
+
+    /**
+     * cutoff 이전 알림을 최대 limit개 보관 테이블로 이동
+     * - ID를 먼저 잠그고, 보관/삭제 모두 같은 ID 목록으로 실행
+     * - 건수가 어긋나면 예외로 롤백 (보관 안 된 알림이 삭제되는 것 방지)
+     * @return 이동한 행 수
+     */
+    @Transactional
+    public int archiveOldBatch(LocalDateTime cutoff, int limit) {
+        List<Long> ids = notificationRepository.findOldNotificationIdsForUpdate(cutoff, limit);
+        if (ids.isEmpty()) {
+            return 0;
+        }
+
+        int archived = notificationArchiveRepository.archiveByNotificationIds(ids);
+        int deleted = notificationRepository.deleteByNotificationIds(ids);
+        if (archived != ids.size() || deleted != ids.size()) {
+            throw new IllegalStateException(String.format(
+                    "알림 보관/삭제 건수 불일치: ids=%d, archived=%d, deleted=%d", ids.size(), archived, deleted));
+        }
+        return ids.size();
+    }
+}
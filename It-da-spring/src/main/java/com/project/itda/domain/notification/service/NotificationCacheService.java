@@ -0,0 +1,213 @@
+package com.project.itda.domain.notification.service;
+
+import com.fasterxml.jackson.databind.ObjectMapper;
+import com.project.itda.domain.notification.dto.response.NotificationListResponse;
+import lombok.RequiredArgsConstructor;
+import lombok.extern.slf4j.Slf4j;
+import org.springframework.data.redis.core.RedisTemplate;
+import org.springframework.stereotype.Service;
+import org.springframework.transaction.support.TransactionSynchronization;
+import org.springframework.transaction.support.TransactionSynchronizationManager;
+
+import java.time.Duration;
+import java.time.LocalDateTime;
+
+/**
+ * ✅ 알림 Redis 캐시
+ * - 배지 폴링용 COUNT 쿼리를 캐시로 대체
+ * - 최근 알림 목록(첫 페이지/전체)을 사용자별 해시에 캐시, 쓰기 시 버전 증가 + 키 하나 삭제로 무효화
+ * - Redis 장애 시 DB 조회로 자연스럽게 fallback
+ */
+@Slf4j
+@Service
+@RequiredArgsConstructor
+public class NotificationCacheService {
+
+    private static final String UNREAD_COUNT_KEY_PREFIX = "notification:unread:";
+    private static final Duration UNREAD_COUNT_TTL = Duration.ofSeconds(60);
+    private static final String LIST_KEY_PREFIX = "notification:list:";
+    // timeAgo는 조회 시 sentAt 기준으로 다시 계산 (TTL은 쓰기 누락 대비 안전장치)
+    private static final Duration LIST_TTL = Duration.ofSeconds(30);
+    // 목록 무효화 버전 (읽는 동안 무효화가 끼어들었는지 판별, 목록 TTL보다 충분히 길게)
+    private static final String LIST_VERSION_KEY_PREFIX = "notification:list:ver:";
+    private static final Duration LIST_VERSION_TTL = Duration.ofHours(1);
+
+    private final RedisTemplate<String, Object> redisTemplate;
+    private final ObjectMapper objectMapper;
+
+    /**
+     * 캐시된 안읽은 개수 조회 (miss 또는 장애 시 null)
+     */
+    public Long getUnreadCount(Long userId) {
+        try {
+            Object cached = redisTemplate.opsForValue().get(unreadCountKey(userId));
+            // Jackson 역직렬화 시 Integer로 올 수 있으므로 Number로 변환
+            return cached instanceof Number number ? number.longValue() : null;
+        } catch (Exception e) {
+            log.warn("⚠️ 안읽은 알림 캐시 조회 실패: userId={}, {}", userId, e.getMessage());
+            return null;
+        }
+    }
+
+    /**
+     * 안읽은 개수 캐시 저장 (TTL 60초)
+     */
+    public void putUnreadCount(Long userId, long count) {
+        try {
+            redisTemplate.opsForValue().set(unreadCountKey(userId), count, UNREAD_COUNT_TTL);
+        } catch (Exception e) {
+            log.warn("⚠️ 안읽은 알림 캐시 저장 실패: userId={}, {}", userId, e.getMessage());
+        }
+    }
+
+    /**
+     * 방금 계산한 안읽은 개수로 캐시 갱신 (write-through)
+     * - 트랜잭션 안이면 커밋 이후에 저장 (롤백된 값이 캐시되는 것 방지)
+     */
+    public void putUnreadCountAfterCommit(Long userId, long count) {
+        if (userId == null) {
+            return;
+        }
+        if (TransactionSynchronizationManager.isSynchronizationActive()) {
+            TransactionSynchronizationManager.registerSynchronization(new TransactionSynchronization() {
+                @Override
+                public void afterCommit() {
+                    putUnreadCount(userId, count);
+                }
+            });
+        } else {
+            putUnreadCount(userId, count);
+        }
+    }
+
+    /**
+     * 안읽은 개수 캐시 무효화
+     * - 트랜잭션 안이면 커밋 이후에 삭제 (커밋 전 재조회로 옛 값이 다시 캐시되는 것 방지)
+     */
+    public void evictUnreadCount(Long userId) {
+        if (userId == null) {
+            return;
+        }
+        if (TransactionSynchronizationManager.isSynchronizationActive()) {
+            TransactionSynchronizationManager.registerSynchronization(new TransactionSynchronization() {
+                @Override
+                public void afterCommit() {
+                    deleteUnreadCount(userId);
+                }
+            });
+        } else {
+            deleteUnreadCount(userId);
+        }
+    }
+
+    private void deleteUnreadCount(Long userId) {
+        try {
+            redisTemplate.delete(unreadCountKey(userId));
+        } catch (Exception e) {
+            log.warn("⚠️ 안읽은 알림 캐시 삭제 실패: userId={}, {}", userId, e.getMessage());
+        }
+    }
+
+    /**
+     * 캐시된 알림 목록 조회 (miss 또는 장애 시 null)
+     * - field: "all" / "page:{size}" 등 조회 형태별 구분자
+     */
+    public NotificationListResponse getList(Long userId, String field) {
+        try {
+            Object cached = redisTemplate.opsForHash().get(listKey(userId), field);
+            if (!(cached instanceof String json)) {
+                return null;
+            }
+
+            // 캐시에는 저장 시점의 timeAgo가 들어 있으므로 sentAt 기준으로 다시 계산
+            NotificationListResponse response = objectMapper.readValue(json, NotificationListResponse.class);
+            LocalDateTime now = LocalDateTime.now();
+            response.getNotifications().forEach(notification -> notification.refreshTimeAgo(now));
+            return response;
+        } catch (Exception e) {
+            log.warn("⚠️ 알림 목록 캐시 조회 실패: userId={}, {}", userId, e.getMessage());
+            return null;
+        }
+    }
+
+    /**
+     * 현재 목록 무효화 버전 (DB 조회 전에 읽어서 putList에 전달, 장애 시 -1)
+     */
+    public long getListVersion(Long userId) {
+        try {
+            Object version = redisTemplate.opsForValue().get(listVersionKey(userId));
+            // Jackson 역직렬화 시 Integer로 올 수 있으므로 Number로 변환
+            return version instanceof Number number ? number.longValue() : 0L;
+        } catch (Exception e) {
+            log.warn("⚠️ 알림 목록 캐시 버전 조회 실패: userId={}, {}", userId, e.getMessage());
+            return -1L;
+        }
+    }
+
+    /**
+     * 알림 목록 캐시 저장 (사용자 해시 전체 TTL 30초)
+     * - version: 조회 전에 읽은 getListVersion 값
+     * - 저장 후 버전이 바뀌었으면 (조회 중 무효화) 방금 넣은 옛 목록을 다시 삭제
+     */
+    public void putList(Long userId, String field, NotificationListResponse response, long version) {
+        if (version < 0) {
+            return;
+        }
+        try {
+            String key = listKey(userId);
+            redisTemplate.opsForHash().put(key, field, objectMapper.writeValueAsString(response));
+            redisTemplate.expire(key, LIST_TTL);
+
+            // 무효화는 "버전 증가 → 키 삭제" 순서라, 저장 전에 끝났든 저장과 겹쳤든 여기서 걸러짐
+            if (getListVersion(userId) != version) {
+                redisTemplate.delete(key);
+            }
+        } catch (Exception e) {
+            log.warn("⚠️ 알림 목록 캐시 저장 실패: userId={}, {}", userId, e.getMessage());
+        }
+    }
+
+    /**
+     * 알림 목록 캐시 무효화 (생성/읽음/삭제 시)
+     * - 트랜잭션 안이면 커밋 이후에 삭제
+     */
+    public void evictList(Long userId) {
+        if (userId == null) {
+            return;
+        }
+        if (TransactionSynchronizationManager.isSynchronizationActive()) {
+            TransactionSynchronizationManager.registerSynchronization(new TransactionSynchronization() {
+                @Override
+                public void afterCommit() {
+                    deleteList(userId);
+                }
+            });
+        } else {
+            deleteList(userId);
+        }
+    }
+
+    private void deleteList(Long userId) {
+        try {
+            // 버전을 먼저 올려야 진행 중인 조회의 putList가 옛 목록을 되살리지 않음
+            String versionKey = listVersionKey(userId);
+            redisTemplate.opsForValue().increment(versionKey);
+            redisTemplate.expire(versionKey, LIST_VERSION_TTL);
+            redisTemplate.delete(listKey(userId));
+        } catch (Exception e) {
+            log.warn("⚠️ 알림 목록 캐시 삭제 실패: userId={}, {}", userId, e.getMessage());
+        }
+    }
+
+    private String listKey(Long userId) {
+        return LIST_KEY_PREFIX + userId;
+    }
+
+    private String listVersionKey(Long userId) {
+        return LIST_VERSION_KEY_PREFIX + userId;
+    }
+
+    private String unreadCountKey(Long userId) {
+        return UNREAD_COUNT_KEY_PREFIX + userId;
+    }
+}
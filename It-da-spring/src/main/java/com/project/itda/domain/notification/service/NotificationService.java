@@ -15,17 +15,23 @@ import com.project.itda.domain.user.repository.UserSettingRepository;
 import lombok.RequiredArgsConstructor;
 import lombok.extern.slf4j.Slf4j;
 import org.springframework.context.annotation.Lazy;
-import org.springframework.data.domain.Page;
 import org.springframework.data.domain.PageRequest;
 import org.springframework.data.domain.Pageable;
+import org.springframework.data.domain.Slice;
 import org.springframework.messaging.simp.SimpMessageSendingOperations;
 import org.springframework.stereotype.Service;
+import org.springframework.transaction.annotation.Propagation;
 import org.springframework.transaction.annotation.Transactional;
 
+import java.nio.charset.StandardCharsets;
 import java.time.LocalDateTime;
+import java.util.ArrayList;
+import java.util.Base64;
 import java.util.HashMap;
+import java.util.HashSet;
 import java.util.List;
 import java.util.Map;
+import java.util.Set;
 import java.util.stream.Collectors;
 
 @Slf4j
@@ -34,12 +40,21 @@ import java.util.stream.Collectors;
 @Transactional(readOnly = true)
 public class NotificationService {
 
+    // IN 절 파라미터 상한 (대량 요청은 청크 단위로 나눠 실행)
+    private static final int ID_BATCH_SIZE = 500;
+    // 오래된 알림 정리 시 배치(보관+삭제) 1회당 최대 행 수
+    private static final int CLEANUP_BATCH_SIZE = 1000;
+    private static final String LIST_CACHE_ALL = "all";
+    private static final String LIST_CACHE_FIRST_PAGE = "page:";
+
     private final NotificationRepository notificationRepository;
     private final UserRepository userRepository;
     private final PushNotificationService pushNotificationService;
     private final UserFollowRepository userFollowRepository;      // ✅ 추가
     private final UserSettingRepository userSettingRepository;    // ✅ 추가
     private final SimpMessageSendingOperations messagingTemplate;
+    private final NotificationCacheService notificationCacheService;
+    private final NotificationArchiveService notificationArchiveService;
 
     private ChatRoomService chatRoomService;
     public NotificationService(
@@ -49,6 +64,8 @@ public class NotificationService {
             UserFollowRepository userFollowRepository,
             UserSettingRepository userSettingRepository,
             SimpMessageSendingOperations messagingTemplate,
+            NotificationCacheService notificationCacheService,
+            NotificationArchiveService notificationArchiveService,
             @Lazy ChatRoomService chatRoomService) { // 👈 여기에 @Lazy 추가
         this.notificationRepository = notificationRepository;
         this.userRepository = userRepository;
@@ -56,6 +73,8 @@ public class NotificationService {
         this.userFollowRepository = userFollowRepository;
         this.userSettingRepository = userSettingRepository;
         this.messagingTemplate = messagingTemplate;
+        this.notificationCacheService = notificationCacheService;
+        this.notificationArchiveService = notificationArchiveService;
         this.chatRoomService = chatRoomService;
     }
 
@@ -67,44 +86,115 @@ public class NotificationService {
      * 사용자의 알림 목록 조회 (페이징)
      */
     public NotificationListResponse getNotifications(Long userId, int page, int size) {
+        // 첫 페이지만 캐시 (깊은 페이지는 커서 조회로 이동)
+        String cacheField = LIST_CACHE_FIRST_PAGE + size;
+        long listVersion = -1L;
+        if (page == 0) {
+            NotificationListResponse cached = notificationCacheService.getList(userId, cacheField);
+            if (cached != null) {
+                return cached;
+            }
+            // 조회 전 버전 → 조회 중 무효화되면 putList가 옛 목록을 남기지 않음
+            listVersion = notificationCacheService.getListVersion(userId);
+        }
+
         Pageable pageable = PageRequest.of(page, size);
-        Page<Notification> notificationPage = notificationRepository.findByUser_UserIdOrderBySentAtDesc(userId, pageable);
+        // 목록 + 안읽은 개수를 한 번에 조회 (Slice라 전체 COUNT 쿼리 없음)
+        Slice<Object[]> rows = notificationRepository.findSliceWithUnreadCount(userId, pageable);
 
-        List<NotificationResponse> responses = notificationPage.getContent().stream()
-                .map(NotificationResponse::from)
+        LocalDateTime now = LocalDateTime.now();
+        List<NotificationResponse> responses = rows.getContent().stream()
+                .map(row -> NotificationResponse.from((Notification) row[0], now))
                 .collect(Collectors.toList());
 
-        long unreadCount = notificationRepository.countByUser_UserIdAndIsReadFalse(userId);
+        // 마지막 페이지 너머라 행이 없을 때만 별도 COUNT
+        long unreadCount = rows.hasContent()
+                ? ((Number) rows.getContent().get(0)[1]).longValue()
+                : notificationRepository.countByUser_UserIdAndIsReadFalse(userId);
+        notificationCacheService.putUnreadCountAfterCommit(userId, unreadCount);
 
-        return NotificationListResponse.of(
+        String nextCursor = rows.hasNext() ? encodeCursor(responses.get(responses.size() - 1)) : null;
+
+        NotificationListResponse response = NotificationListResponse.of(
                 responses,
                 unreadCount,
                 page,
                 size,
-                notificationPage.hasNext()
+                rows.hasNext(),
+                nextCursor
         );
+        if (page == 0) {
+            notificationCacheService.putList(userId, cacheField, response, listVersion);
+        }
+        return response;
+    }
+
+    /**
+     * 사용자의 알림 목록 조회 (커서 기반, OFFSET 없음)
+     */
+    public NotificationListResponse getNotificationsByCursor(Long userId, String cursor, int size) {
+        NotificationCursor decoded = decodeCursor(cursor);
+
+        // size + 1개 조회해서 다음 페이지 존재 여부 판단
+        List<Object[]> rows = notificationRepository.findAfterCursorWithUnreadCount(
+                userId, decoded.sentAt(), decoded.notificationId(), PageRequest.of(0, size + 1));
+
+        boolean hasNext = rows.size() > size;
+        LocalDateTime now = LocalDateTime.now();
+        List<NotificationResponse> responses = rows.stream()
+                .limit(size)
+                .map(row -> NotificationResponse.from((Notification) row[0], now))
+                .collect(Collectors.toList());
+
+        long unreadCount = rows.isEmpty()
+                ? notificationRepository.countByUser_UserIdAndIsReadFalse(userId)
+                : ((Number) rows.get(0)[1]).longValue();
+        notificationCacheService.putUnreadCountAfterCommit(userId, unreadCount);
+
+        String nextCursor = hasNext ? encodeCursor(responses.get(responses.size() - 1)) : null;
+
+        return NotificationListResponse.of(responses, unreadCount, 0, size, hasNext, nextCursor);
     }
 
     /**
      * 사용자의 모든 알림 목록 조회
      */
     public NotificationListResponse getAllNotifications(Long userId) {
-        List<Notification> notifications = notificationRepository.findByUser_UserIdOrderBySentAtDesc(userId);
+        NotificationListResponse cached = notificationCacheService.getList(userId, LIST_CACHE_ALL);
+        if (cached != null) {
+            return cached;
+        }
+        long listVersion = notificationCacheService.getListVersion(userId);
+
+        // 목록 + 안읽은 개수를 한 번에 조회 (별도 COUNT 왕복 제거)
+        List<Object[]> rows = notificationRepository.findAllWithUnreadCount(userId);
 
-        List<NotificationResponse> responses = notifications.stream()
-                .map(NotificationResponse::from)
+        LocalDateTime now = LocalDateTime.now();
+        List<NotificationResponse> responses = rows.stream()
+                .map(row -> NotificationResponse.from((Notification) row[0], now))
                 .collect(Collectors.toList());
 
-        long unreadCount = notificationRepository.countByUser_UserIdAndIsReadFalse(userId);
+        // 알림이 하나도 없으면 안읽은 개수도 0
+        long unreadCount = rows.isEmpty() ? 0L : ((Number) rows.get(0)[1]).longValue();
+        notificationCacheService.putUnreadCountAfterCommit(userId, unreadCount);
 
-        return NotificationListResponse.of(responses, unreadCount);
+        NotificationListResponse response = NotificationListResponse.of(responses, unreadCount);
+        notificationCacheService.putList(userId, LIST_CACHE_ALL, response, listVersion);
+        return response;
     }
 
     /**
      * 읽지 않은 알림 개수 조회
      */
     public long getUnreadCount(Long userId) {
-        return notificationRepository.countByUser_UserIdAndIsReadFalse(userId);
+        Long cached = notificationCacheService.getUnreadCount(userId);
+        if (cached != null) {
+            return cached;
+        }
+
+        long count = notificationRepository.countByUser_UserIdAndIsReadFalse(userId);
+        notificationCacheService.putUnreadCount(userId, count);
+        return count;
     }
 
     // ========================================
@@ -116,8 +206,13 @@ public class NotificationService {
      */
     @Transactional
     public void markAsRead(Long notificationId) {
-        notificationRepository.markAsRead(notificationId);
-        log.info("✅ 알림 읽음 처리: notificationId={}", notificationId);
+        int updated = notificationRepository.markAsRead(notificationId);
+        // 이미 읽은 알림이면 개수 변화 없음 → 캐시/푸시 생략
+        if (updated > 0) {
+            notificationRepository.findUserIdByNotificationId(notificationId)
+                    .ifPresent(this::refreshUnreadCount);
+        }
+        log.info("✅ 알림 읽음 처리: notificationId={}, updated={}", notificationId, updated);
     }
 
     /**
@@ -126,17 +221,57 @@ public class NotificationService {
     @Transactional
     public int markAllAsRead(Long userId) {
         int count = notificationRepository.markAllAsRead(userId);
+        notificationCacheService.putUnreadCountAfterCommit(userId, 0);
+        notificationCacheService.evictList(userId);
+        pushNotificationService.pushUnreadCount(userId, 0);
         log.info("✅ 모든 알림 읽음 처리: userId={}, count={}", userId, count);
         return count;
     }
 
     /**
-     * 알림 삭제
+     * 여러 알림 일괄 읽음 처리
+     */
+    @Transactional
+    public int markAsRead(Long userId, List<Long> notificationIds) {
+        int count = 0;
+        for (List<Long> chunk : chunk(notificationIds)) {
+            count += notificationRepository.markAsReadByIds(userId, chunk);
+        }
+        if (count > 0) {
+            refreshUnreadCount(userId);
+        }
+        log.info("✅ 알림 일괄 읽음 처리: userId={}, requested={}, updated={}", userId, notificationIds.size(), count);
+        return count;
+    }
+
+    /**
+     * 알림 삭제 (본인 알림만, 단일 DELETE)
+     * - 개수 재조회 대신 캐시만 무효화 (다음 조회 시 재계산)
+     */
+    @Transactional
+    public void deleteNotification(Long userId, Long notificationId) {
+        int deleted = notificationRepository.deleteByNotificationIdAndUserId(notificationId, userId);
+        if (deleted > 0) {
+            notificationCacheService.evictUnreadCount(userId);
+            notificationCacheService.evictList(userId);
+        }
+        log.info("🗑️ 알림 삭제: notificationId={}, deleted={}", notificationId, deleted);
+    }
+
+    /**
+     * 여러 알림 일괄 삭제
      */
     @Transactional
-    public void deleteNotification(Long notificationId) {
-        notificationRepository.deleteById(notificationId);
-        log.info("🗑️ 알림 삭제: notificationId={}", notificationId);
+    public int deleteNotifications(Long userId, List<Long> notificationIds) {
+        int count = 0;
+        for (List<Long> chunk : chunk(notificationIds)) {
+            count += notificationRepository.deleteByIds(userId, chunk);
+        }
+        if (count > 0) {
+            refreshUnreadCount(userId);
+        }
+        log.info("🗑️ 알림 일괄 삭제: userId={}, requested={}, deleted={}", userId, notificationIds.size(), count);
+        return count;
     }
 
     /**
@@ -145,9 +280,33 @@ public class NotificationService {
     @Transactional
     public void deleteAllNotifications(Long userId) {
         notificationRepository.deleteAllByUserId(userId);
+        notificationCacheService.putUnreadCountAfterCommit(userId, 0);
+        notificationCacheService.evictList(userId);
+        pushNotificationService.pushUnreadCount(userId, 0);
         log.info("🗑️ 모든 알림 삭제: userId={}", userId);
     }
 
+    /**
+     * ID 목록을 ID_BATCH_SIZE 단위로 분할 (한 트랜잭션 안에서 청크별 UPDATE/DELETE)
+     */
+    private static List<List<Long>> chunk(List<Long> ids) {
+        List<List<Long>> chunks = new ArrayList<>();
+        for (int i = 0; i < ids.size(); i += ID_BATCH_SIZE) {
+            chunks.add(ids.subList(i, Math.min(i + ID_BATCH_SIZE, ids.size())));
+        }
+        return chunks;
+    }
+
+    /**
+     * 안읽은 개수 변경 반영: 최신 개수로 캐시 갱신 + 목록 캐시 무효화 + 웹소켓 푸시 (클라이언트 폴링 대체)
+     */
+    private void refreshUnreadCount(Long userId) {
+        long unreadCount = notificationRepository.countByUser_UserIdAndIsReadFalse(userId);
+        notificationCacheService.putUnreadCountAfterCommit(userId, unreadCount);
+        notificationCacheService.evictList(userId);
+        pushNotificationService.pushUnreadCount(userId, unreadCount);
+    }
+
     // ========================================
     // 알림 생성 메서드들
     // ========================================
@@ -180,13 +339,48 @@ public class NotificationService {
                 .build();
 
         notification = notificationRepository.save(notification);
+        notificationCacheService.evictUnreadCount(receiver.getUserId());
+        notificationCacheService.evictList(receiver.getUserId());
         log.info("🔔 알림 생성: type={}, receiver={}, sender={}", type, receiver.getUserId(), senderId);
 
-        // 2. 웹소켓 실시간 전송 (여기가 에러 포인트!)
+        // 2. 웹소켓 실시간 전송
+        pushSafely(notification);
+
+        return notification;
+    }
+
+    /**
+     * 여러 알림 일괄 생성 (팬아웃용)
+     * - 한 트랜잭션에서 saveAll, 수신자별 건별 save/commit 반복 제거
+     */
+    @Transactional
+    public List<Notification> createNotifications(List<Notification> notifications) {
+        if (notifications.isEmpty()) {
+            return notifications;
+        }
+
+        List<Notification> saved = notificationRepository.saveAll(notifications);
+        saved.stream()
+                .map(notification -> notification.getUser().getUserId())
+                .distinct()
+                .forEach(userId -> {
+                    notificationCacheService.evictUnreadCount(userId);
+                    notificationCacheService.evictList(userId);
+                });
+        log.info("🔔 알림 일괄 생성: count={}", saved.size());
+
+        saved.forEach(this::pushSafely);
+        return saved;
+    }
+
+    /**
+     * 웹소켓 실시간 전송 (실패해도 DB 저장은 유지)
+     */
+    private void pushSafely(Notification notification) {
         try {
             // pushNotificationService가 null이 아닌지 체크
             if (pushNotificationService != null) {
-                pushNotificationService.pushNotification(receiver.getUserId(), NotificationResponse.from(notification));
+                pushNotificationService.pushNotification(notification.getUser().getUserId(), NotificationResponse.from(notification));
             } else {
                 log.warn("⚠️ PushNotificationService가 주입되지 않았습니다.");
             }
@@ -194,8 +388,6 @@ public class NotificationService {
             // 웹소켓 전송 실패해도 로직은 계속 진행되어야 함 (로그만 남김)
             log.error("❌ 실시간 알림 전송 실패 (DB 저장은 성공): {}", e.getMessage());
         }
-
-        return notification;
     }
 
     // ========================================
@@ -371,11 +563,60 @@ public class NotificationService {
         );
     }
 
+    /**
+     * ✅ 팔로우한 사람이 모임에 참가했을 때 여러 팔로워에게 일괄 알림
+     * - 설정 조회 1회 + saveAll (수신자별 설정 조회/저장 반복 제거)
+     */
+    @Transactional
+    public int notifyFollowersMeetingJoin(List<User> receivers, User followedUser, Long meetingId, String meetingTitle) {
+        if (receivers.isEmpty()) {
+            return 0;
+        }
+
+        Set<Long> optedOut = new HashSet<>(userSettingRepository.findUserIdsWithFollowMeetingNotificationOff(
+                receivers.stream().map(User::getUserId).collect(Collectors.toList())));
+
+        List<Notification> notifications = new ArrayList<>();
+        for (User receiver : receivers) {
+            if (optedOut.contains(receiver.getUserId())) {
+                log.info("⏭️ 팔로우 모임 참가 알림 스킵 (설정 OFF): receiverId={}", receiver.getUserId());
+                continue;
+            }
+
+            notifications.add(Notification.builder()
+                    .user(receiver)
+                    .notificationType(NotificationType.MEETING_FOLLOW)
+                    .title(followedUser.getUsername() + "님이 새 모임에 참가했습니다")
+                    .content("💡 " + meetingTitle + " 모임에 참가했습니다.")
+                    .linkUrl("/meetings/" + meetingId)
+                    .relatedId(meetingId)
+                    .senderId(followedUser.getUserId())
+                    .senderName(followedUser.getUsername())
+                    .senderProfileImage(followedUser.getProfileImageUrl())
+                    .build());
+        }
+
+        return createNotifications(notifications).size();
+    }
+
     /**
      * 모임 리마인더 알림 (D-1, D-day)
      */
     @Transactional
     public void notifyMeetingReminder(User receiver, Long meetingId, String meetingTitle, String reminderType) {
+        notifyMeetingReminders(List.of(receiver), meetingId, meetingTitle, reminderType);
+    }
+
+    /**
+     * ✅ 모임 리마인더 일괄 알림 (스케줄러용)
+     * - 한 모임의 참가자 전원을 saveAll 한 번으로 저장
+     */
+    @Transactional
+    public int notifyMeetingReminders(List<User> receivers, Long meetingId, String meetingTitle, String reminderType) {
+        if (receivers.isEmpty()) {
+            return 0;
+        }
+
         String title;
         String content;
 
@@ -390,17 +631,18 @@ public class NotificationService {
             content = "📅 모임 일정을 확인해주세요.";
         }
 
-        createNotification(
-                receiver,
-                NotificationType.MEETING_REMINDER,
-                title,
-                content,
-                "/meetings/" + meetingId,
-                meetingId,
-                null,
-                null,
-                null
-        );
+        List<Notification> notifications = receivers.stream()
+                .map(receiver -> Notification.builder()
+                        .user(receiver)
+                        .notificationType(NotificationType.MEETING_REMINDER)
+                        .title(title)
+                        .content(content)
+                        .linkUrl("/meetings/" + meetingId)
+                        .relatedId(meetingId)
+                        .build())
+                .collect(Collectors.toList());
+
+        return createNotifications(notifications).size();
     }
 
     // ========================================
@@ -436,17 +678,26 @@ public class NotificationService {
      */
     @Transactional
     public void notifyReviewRequest(User receiver, Long meetingId, String meetingTitle) {
-        createNotification(
-                receiver,
-                NotificationType.REVIEW_REQUEST,
-                "'" + meetingTitle + "' 모임은 어떠셨나요?",
-                "⭐ 후기를 작성해주세요!",
-                "/meeting/" + meetingId + "/review",
-                meetingId,
-                null,
-                null,
-                null
-        );
+        notifyReviewRequests(List.of(receiver), meetingId, meetingTitle);
+    }
+
+    /**
+     * ✅ 후기 작성 요청 일괄 알림 (스케줄러용)
+     */
+    @Transactional
+    public int notifyReviewRequests(List<User> receivers, Long meetingId, String meetingTitle) {
+        List<Notification> notifications = receivers.stream()
+                .map(receiver -> Notification.builder()
+                        .user(receiver)
+                        .notificationType(NotificationType.REVIEW_REQUEST)
+                        .title("'" + meetingTitle + "' 모임은 어떠셨나요?")
+                        .content("⭐ 후기를 작성해주세요!")
+                        .linkUrl("/meeting/" + meetingId + "/review")
+                        .relatedId(meetingId)
+                        .build())
+                .collect(Collectors.toList());
+
+        return createNotifications(notifications).size();
     }
 
     /**
@@ -457,41 +708,43 @@ public class NotificationService {
     public void notifyFollowersAboutReview(User reviewWriter, Long reviewId, Long meetingId, String meetingTitle) {
         log.info("📝 팔로우 후기 작성 알림 시작: writerId={}, meetingTitle={}", reviewWriter.getUserId(), meetingTitle);
 
-        // 이 사람(reviewWriter)을 팔로우하는 모든 사람 조회
-        List<UserFollow> followers = userFollowRepository.findByFollowing(reviewWriter);
+        // 이 사람(reviewWriter)을 팔로우하는 모든 사람 조회 (본인 제외)
+        List<User> followers = userFollowRepository.findByFollowing(reviewWriter).stream()
+                .map(UserFollow::getFollower)
+                .filter(follower -> !follower.getUserId().equals(reviewWriter.getUserId()))
+                .collect(Collectors.toList());
+        if (followers.isEmpty()) {
+            return;
+        }
 
-        int sentCount = 0;
-        for (UserFollow follow : followers) {
-            User follower = follow.getFollower();
+        // ✅ followReviewNotification 설정을 끈 팔로워를 한 번에 조회
+        Set<Long> optedOut = new HashSet<>(userSettingRepository.findUserIdsWithFollowReviewNotificationOff(
+                followers.stream().map(User::getUserId).collect(Collectors.toList())));
 
-            // 본인 제외
-            if (follower.getUserId().equals(reviewWriter.getUserId())) {
-                continue;
-            }
-
-            // ✅ UserSetting에서 followReviewNotification 설정 확인
-            UserSetting setting = userSettingRepository.findByUser_UserId(follower.getUserId()).orElse(null);
-            if (setting != null && Boolean.FALSE.equals(setting.getFollowReviewNotification())) {
+        List<Notification> notifications = new ArrayList<>();
+        for (User follower : followers) {
+            if (optedOut.contains(follower.getUserId())) {
                 log.info("⏭️ 팔로우 후기 알림 스킵 (설정 OFF): followerId={}", follower.getUserId());
                 continue;
             }
 
-            // 알림 생성
-            createNotification(
-                    follower,
-                    NotificationType.REVIEW,  // 또는 REVIEW_FOLLOW 타입 추가 가능
-                    reviewWriter.getUsername() + "님이 후기를 작성했습니다",
-                    "⭐ '" + meetingTitle + "' 모임에 대한 후기를 남겼습니다.",
-                    "/meetings/" + meetingId,
-                    reviewId,
-                    reviewWriter.getUserId(),
-                    reviewWriter.getUsername(),
-                    reviewWriter.getProfileImageUrl()
-            );
-            sentCount++;
+            notifications.add(Notification.builder()
+                    .user(follower)
+                    .notificationType(NotificationType.REVIEW)  // 또는 REVIEW_FOLLOW 타입 추가 가능
+                    .title(reviewWriter.getUsername() + "님이 후기를 작성했습니다")
+                    .content("⭐ '" + meetingTitle + "' 모임에 대한 후기를 남겼습니다.")
+                    .linkUrl("/meetings/" + meetingId)
+                    .relatedId(reviewId)
+                    .senderId(reviewWriter.getUserId())
+                    .senderName(reviewWriter.getUsername())
+                    .senderProfileImage(reviewWriter.getProfileImageUrl())
+                    .build());
         }
 
-        log.info("🔔 팔로우 후기 알림 전송 완료: {}명에게 전송", sentCount);
+        // 알림 일괄 생성
+        createNotifications(notifications);
+
+        log.info("🔔 팔로우 후기 알림 전송 완료: {}명에게 전송", notifications.size());
     }
 
     // ========================================
@@ -538,6 +791,30 @@ public class NotificationService {
     // 유틸리티 메서드
     // ========================================
 
+    /**
+     * 커서 인코딩: base64("sentAt|notificationId")
+     */
+    private static String encodeCursor(NotificationResponse last) {
+        String raw = last.getSentAt() + "|" + last.getNotificationId();
+        return Base64.getUrlEncoder().withoutPadding().encodeToString(raw.getBytes(StandardCharsets.UTF_8));
+    }
+
+    /**
+     * 커서 디코딩
+     */
+    private static NotificationCursor decodeCursor(String cursor) {
+        try {
+            String raw = new String(Base64.getUrlDecoder().decode(cursor), StandardCharsets.UTF_8);
+            String[] parts = raw.split("\\|");
+            return new NotificationCursor(LocalDateTime.parse(parts[0]), Long.valueOf(parts[1]));
+        } catch (RuntimeException e) {
+            throw new IllegalArgumentException("잘못된 커서입니다: " + cursor);
+        }
+    }
+
+    private record NotificationCursor(LocalDateTime sentAt, Long notificationId) {
+    }
+
     /**
      * 중복 알림 체크
      */
@@ -548,13 +825,19 @@ public class NotificationService {
     }
 
     /**
-     * 오래된 알림 삭제 (30일 이상)
+     * 오래된 알림 정리 (30일 이상) - notifications_archive로 이동 후 삭제
+     * - CLEANUP_BATCH_SIZE개씩 나눠 처리, 배치마다 별도 트랜잭션으로 커밋
      */
-    @Transactional
+    @Transactional(propagation = Propagation.NOT_SUPPORTED)
     public int cleanupOldNotifications() {
         LocalDateTime thirtyDaysAgo = LocalDateTime.now().minusDays(30);
-        int deleted = notificationRepository.deleteOldNotifications(thirtyDaysAgo);
-        log.info("🗑️ 오래된 알림 삭제: {}개", deleted);
+        int deleted = 0;
+        int batch;
+        do {
+            batch = notificationArchiveService.archiveOldBatch(thirtyDaysAgo, CLEANUP_BATCH_SIZE);
+            deleted += batch;
+        } while (batch == CLEANUP_BATCH_SIZE);
+        log.info("🗑️ 오래된 알림 보관 후 삭제: {}개", deleted);
         return deleted;
     }
     @Transactional
@@ -592,8 +875,10 @@ public class NotificationService {
         // (chatRoomService.joinChatRoomWithNotification 로직은 아래에서 따로 제안해 드립니다)
         chatRoomService.acceptInvitation(roomId, receiver.getUserId());
 
-        // 5. 알림 읽음 처리 및 가입 완료 메시지로 업데이트 (선택 사항)
-        notification.markAsRead();
+        // 5. 알림 읽음 처리 (DB CURRENT_TIMESTAMP 사용, 더티체킹 전체 컬럼 UPDATE 회피)
+        if (notificationRepository.markAsRead(notificationId) > 0) {
+            refreshUnreadCount(receiver.getUserId());
+        }
 
         sendWelcomeMessage(roomId, receiver);
 
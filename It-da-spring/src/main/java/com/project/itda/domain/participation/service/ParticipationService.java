@@ -115,22 +115,20 @@ public class ParticipationService {
      * ✅ 팔로워들에게 모임 참가 알림
      */
     private void notifyFollowersAboutMeetingJoin(User participant, Meeting meeting) {
-        List<UserFollow> followers = userFollowRepository.findByFollowing(participant);
-
-        int count = 0;
-        for (UserFollow follow : followers) {
-            User follower = follow.getFollower();
-            if (!follower.getUserId().equals(participant.getUserId())
-                    && !follower.getUserId().equals(meeting.getOrganizer().getUserId())) {
-                notificationService.notifyFollowerMeetingJoin(
-                        follower,
-                        participant,
-                        meeting.getMeetingId(),
-                        meeting.getTitle()
-                );
-                count++;
-            }
-        }
+        Long organizerId = meeting.getOrganizer().getUserId();
+        List<User> receivers = userFollowRepository.findByFollowing(participant).stream()
+                .map(UserFollow::getFollower)
+                .filter(follower -> !follower.getUserId().equals(participant.getUserId())
+                        && !follower.getUserId().equals(organizerId))
+                .toList();
+
+        // 설정 확인 + 저장을 한 번에 처리
+        int count = notificationService.notifyFollowersMeetingJoin(
+                receivers,
+                participant,
+                meeting.getMeetingId(),
+                meeting.getTitle()
+        );
         log.info("🔔 팔로워 {}명에게 모임 참가 알림 전송", count);
     }
 
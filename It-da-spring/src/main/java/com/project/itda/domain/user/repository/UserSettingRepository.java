@@ -35,6 +35,17 @@ public interface UserSettingRepository extends JpaRepository<UserSetting, Long>
             "AND us.user.userId IN :userIds")
     List<UserSetting> findUsersWithMeetingReminderEnabled(@Param("userIds") List<Long> userIds);
 
+    // 팔로우 알림 팬아웃용: 설정을 끈 유저 ID만 한 번에 조회 (수신자별 N회 조회 방지)
+    @Query("SELECT us.user.userId FROM UserSetting us " +
+            "WHERE us.followMeetingNotification = false " +
+            "AND us.user.userId IN :userIds")
+    List<Long> findUserIdsWithFollowMeetingNotificationOff(@Param("userIds") List<Long> userIds);
+
+    @Query("SELECT us.user.userId FROM UserSetting us " +
+            "WHERE us.followReviewNotification = false " +
+            "AND us.user.userId IN :userIds")
+    List<Long> findUserIdsWithFollowReviewNotificationOff(@Param("userIds") List<Long> userIds);
+
     // === 프라이버시 설정 조회 ===
 
     List<UserSetting> findByProfileVisibility(ProfileVisibility visibility);
@@ -1,5 +1,6 @@
 package com.project.itda.domain.user.service;
 
+import com.project.itda.domain.ai.service.AIServiceClient;
 import com.project.itda.domain.user.dto.request.UserPreferenceRequest;
 import com.project.itda.domain.user.dto.response.UserPreferenceResponse;
 import com.project.itda.domain.user.entity.User;
@@ -20,6 +21,7 @@ public class UserPreferenceService {
 
     private final UserPreferenceRepository userPreferenceRepository;
     private final UserRepository userRepository;
+    private final AIServiceClient aiServiceClient;
 
     /**
      * 사용자 선호도 조회
@@ -75,6 +77,7 @@ public class UserPreferenceService {
         }
 
         preference = userPreferenceRepository.save(preference);
+        aiServiceClient.invalidateUserContextAfterCommit(userId);
         return mapToResponse(preference);
     }
 
@@ -1,5 +1,6 @@
 package com.project.itda.domain.user.service;
 
+import com.project.itda.domain.ai.service.AIServiceClient;
 import com.project.itda.domain.review.repository.ReviewRepository;
 import com.project.itda.domain.user.dto.request.UserContextDTO;
 import com.project.itda.domain.user.dto.request.UserSignupRequest;
@@ -40,6 +41,7 @@ public class UserService {
     private final GeocodingService geocodingService;
     private final ReviewRepository reviewRepository;
     private final UserFollowService userFollowService;
+    private final AIServiceClient aiServiceClient;
 
     @Transactional
     public UserResponse signup(UserSignupRequest request) {
@@ -157,6 +159,7 @@ public class UserService {
         }
 
         userFollowService.notifyProfileUpdate(userId);
+        aiServiceClient.invalidateUserContextAfterCommit(userId);
         log.info("✅ 프로필 업데이트 및 알림 전송: userId={}", userId);
 
         } catch (Exception e) {
@@ -1,5 +1,8 @@
 package com.project.itda.global.config;
 
+import org.hibernate.cfg.AvailableSettings;
+import org.springframework.boot.autoconfigure.orm.jpa.HibernatePropertiesCustomizer;
+import org.springframework.context.annotation.Bean;
 import org.springframework.context.annotation.Configuration;
 import org.springframework.data.jpa.repository.config.EnableJpaAuditing;
 import org.springframework.data.jpa.repository.config.EnableJpaRepositories;
@@ -8,4 +11,12 @@ import org.springframework.data.jpa.repository.config.EnableJpaRepositories;
 @EnableJpaAuditing
 @EnableJpaRepositories(basePackages = "com.project.itda.domain")
 public class JpaConfig {
-}
\ No newline at end of file
+
+    /**
+     * ✅ 요청당 SQL 횟수 집계용 StatementInspector 등록
+     */
+    @Bean
+    public HibernatePropertiesCustomizer queryCountCustomizer() {
+        return properties -> properties.put(AvailableSettings.STATEMENT_INSPECTOR, new QueryCountInspector());
+    }
+}
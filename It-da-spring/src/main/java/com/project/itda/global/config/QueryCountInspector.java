@@ -0,0 +1,35 @@
+package com.project.itda.global.config;
+
+import org.hibernate.resource.jdbc.spi.StatementInspector;
+
+/**
+ * ✅ 요청 단위 SQL 실행 횟수 카운터 (N+1 회귀 감지용)
+ * - Hibernate가 SQL을 준비할 때마다 호출됨
+ * - start()로 시작한 스레드에서만 집계 (스케줄러 등은 무시)
+ */
+public class QueryCountInspector implements StatementInspector {
+
+    private static final ThreadLocal<int[]> COUNTER = new ThreadLocal<>();
+
+    public static void start() {
+        COUNTER.set(new int[1]);
+    }
+
+    /**
+     * 집계 종료 후 누적 횟수 반환 (시작하지 않았으면 0)
+     */
+    public static int stop() {
+        int[] counter = COUNTER.get();
+        COUNTER.remove();
+        return counter == null ? 0 : counter[0];
+    }
+
+    @Override
+    public String inspect(String sql) {
+        int[] counter = COUNTER.get();
+        if (counter != null) {
+            counter[0]++;
+        }
+        return sql;
+    }
+}
@@ -0,0 +1,32 @@
+package com.project.itda.global.config;
+
+import jakarta.servlet.http.HttpServletRequest;
+import jakarta.servlet.http.HttpServletResponse;
+import lombok.extern.slf4j.Slf4j;
+import org.springframework.web.servlet.HandlerInterceptor;
+
+/**
+ * ✅ 알림 API 요청당 SQL 횟수 로깅
+ * - 임계치 초과 시 WARN (목록 조회 = 목록+안읽은 개수 1쿼리, 쓰기 = UPDATE/DELETE + 개수 재조회 수준)
+ */
+@Slf4j
+public class QueryCountInterceptor implements HandlerInterceptor {
+
+    private static final int WARN_THRESHOLD = 5;
+
+    @Override
+    public boolean preHandle(HttpServletRequest request, HttpServletResponse response, Object handler) {
+        QueryCountInspector.start();
+        return true;
+    }
+
+    @Override
+    public void afterCompletion(HttpServletRequest request, HttpServletResponse response, Object handler, Exception ex) {
+        int count = QueryCountInspector.stop();
+        if (count > WARN_THRESHOLD) {
+            log.warn("⚠️ SQL 과다 실행 (N+1 의심): {} {} → {}회", request.getMethod(), request.getRequestURI(), count);
+        } else {
+            log.debug("🔢 SQL 실행 횟수: {} {} → {}회", request.getMethod(), request.getRequestURI(), count);
+        }
+    }
+}
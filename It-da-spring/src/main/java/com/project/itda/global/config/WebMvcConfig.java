@@ -1,6 +1,7 @@
 package com.project.itda.global.config;
 
 import org.springframework.context.annotation.Configuration;
+import org.springframework.web.servlet.config.annotation.InterceptorRegistry;
 import org.springframework.web.servlet.config.annotation.ResourceHandlerRegistry;
 import org.springframework.web.servlet.config.annotation.WebMvcConfigurer;
 
@@ -16,4 +17,11 @@ public class WebMvcConfig implements WebMvcConfigurer {
         registry.addResourceHandler("/uploads/**")
                 .addResourceLocations(uploadPath);
     }
+
+    @Override
+    public void addInterceptors(InterceptorRegistry registry) {
+        // ✅ 알림 API SQL 횟수 감시 (N+1 회귀 감지)
+        registry.addInterceptor(new QueryCountInterceptor())
+                .addPathPatterns("/api/notifications", "/api/notifications/**");
+    }
 }
\ No newline at end of file
@@ -0,0 +1,164 @@
+package com.project.itda.domain.notification.repository;
+
+import com.project.itda.domain.notification.entity.Notification;
+import com.project.itda.domain.notification.entity.NotificationArchive;
+import com.project.itda.domain.notification.enums.NotificationType;
+import com.project.itda.domain.user.entity.User;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.Test;
+import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.boot.test.autoconfigure.jdbc.AutoConfigureTestDatabase;
+import org.springframework.boot.test.autoconfigure.orm.jpa.DataJpaTest;
+import org.springframework.boot.test.autoconfigure.orm.jpa.TestEntityManager;
+import org.springframework.data.domain.PageRequest;
+import org.springframework.data.domain.Slice;
+
+import java.time.LocalDateTime;
+import java.util.List;
+
+import static org.assertj.core.api.Assertions.assertThat;
+
+/**
+ * ✅ 알림 리포지토리 쿼리 테스트 (H2 MySQL 모드)
+ */
+@DataJpaTest(properties = {
+        "spring.datasource.url=jdbc:h2:mem:notification;MODE=MySQL;DATABASE_TO_LOWER=TRUE;DB_CLOSE_DELAY=-1",
+        "spring.datasource.driver-class-name=org.h2.Driver",
+        "spring.jpa.hibernate.ddl-auto=create-drop",
+        "spring.jpa.properties.hibernate.dialect=org.hibernate.dialect.H2Dialect"
+})
+@AutoConfigureTestDatabase(replace = AutoConfigureTestDatabase.Replace.NONE)
+class NotificationRepositoryTest {
+
+    private static final LocalDateTime BASE = LocalDateTime.of(2025, 1, 1, 12, 0);
+
+    @Autowired
+    private TestEntityManager em;
+
+    @Autowired
+    private NotificationRepository notificationRepository;
+
+    @Autowired
+    private NotificationArchiveRepository notificationArchiveRepository;
+
+    private User user;
+    private User other;
+
+    @BeforeEach
+    void setUp() {
+        user = em.persist(User.builder().email("user@itda.com").username("user").build());
+        other = em.persist(User.builder().email("other@itda.com").username("other").build());
+    }
+
+    @Test
+    void findSliceWithUnreadCount_최신순_안읽은개수_다음페이지() {
+        save(user, BASE.minusMinutes(3), false);
+        Notification middle = save(user, BASE.minusMinutes(2), true);
+        Notification newest = save(user, BASE.minusMinutes(1), false);
+        save(other, BASE, false);
+
+        Slice<Object[]> slice = notificationRepository.findSliceWithUnreadCount(user.getUserId(), PageRequest.of(0, 2));
+
+        assertThat(slice.getContent()).extracting(row -> ((Notification) row[0]).getNotificationId())
+                .containsExactly(newest.getNotificationId(), middle.getNotificationId());
+        assertThat(((Number) slice.getContent().get(0)[1]).longValue()).isEqualTo(2L);
+        assertThat(slice.hasNext()).isTrue();
+    }
+
+    @Test
+    void findAfterCursorWithUnreadCount_같은_sentAt은_ID로_이어서_조회() {
+        Notification a = save(user, BASE, false);
+        Notification b = save(user, BASE, false);
+        Notification c = save(user, BASE.minusMinutes(1), true);
+
+        // 커서 = (BASE, b) → 같은 시각의 더 작은 ID(a) + 이전 시각(c)
+        List<Object[]> rows = notificationRepository.findAfterCursorWithUnreadCount(
+                user.getUserId(), BASE, b.getNotificationId(), PageRequest.of(0, 10));
+
+        assertThat(rows).extracting(row -> ((Notification) row[0]).getNotificationId())
+                .containsExactly(a.getNotificationId(), c.getNotificationId());
+        assertThat(((Number) rows.get(0)[1]).longValue()).isEqualTo(2L);
+    }
+
+    @Test
+    void markAsReadByIds_본인_안읽은_알림만_갱신() {
+        Notification mine = save(user, BASE, false);
+        Notification alreadyRead = save(user, BASE, true);
+        Notification others = save(other, BASE, false);
+
+        int updated = notificationRepository.markAsReadByIds(user.getUserId(),
+                List.of(mine.getNotificationId(), alreadyRead.getNotificationId(), others.getNotificationId()));
+
+        assertThat(updated).isEqualTo(1);
+        assertThat(notificationRepository.countByUser_UserIdAndIsReadFalse(user.getUserId())).isZero();
+        assertThat(notificationRepository.countByUser_UserIdAndIsReadFalse(other.getUserId())).isEqualTo(1L);
+    }
+
+    @Test
+    void deleteByIds_본인_알림만_삭제() {
+        Notification mine = save(user, BASE, false);
+        Notification others = save(other, BASE, false);
+
+        int deleted = notificationRepository.deleteByIds(user.getUserId(),
+                List.of(mine.getNotificationId(), others.getNotificationId()));
+
+        assertThat(deleted).isEqualTo(1);
+        assertThat(notificationRepository.existsById(others.getNotificationId())).isTrue();
+    }
+
+    @Test
+    void deleteByNotificationIdAndUserId_다른_사용자_알림은_삭제안함() {
+        Notification mine = save(user, BASE, false);
+
+        assertThat(notificationRepository.deleteByNotificationIdAndUserId(mine.getNotificationId(), other.getUserId()))
+                .isZero();
+        assertThat(notificationRepository.deleteByNotificationIdAndUserId(mine.getNotificationId(), user.getUserId()))
+                .isEqualTo(1);
+    }
+
+    @Test
+    void 오래된_알림_배치_보관후_삭제() {
+        LocalDateTime cutoff = BASE.minusDays(30);
+        Notification old1 = save(user, cutoff.minusDays(2), true);
+        Notification old2 = save(other, cutoff.minusDays(1), false);
+        Notification old3 = save(user, cutoff.minusHours(1), false);
+        Notification recent = save(user, cutoff.plusDays(1), false);
+
+        // 오래된 순으로 limit개만 선택
+        List<Long> ids = notificationRepository.findOldNotificationIdsForUpdate(cutoff, 2);
+        assertThat(ids).containsExactly(old1.getNotificationId(), old2.getNotificationId());
+
+        assertThat(notificationArchiveRepository.archiveByNotificationIds(ids)).isEqualTo(2);
+        assertThat(notificationRepository.deleteByNotificationIds(ids)).isEqualTo(2);
+        em.clear();
+
+        assertThat(notificationArchiveRepository.findAllById(ids))
+                .extracting(NotificationArchive::getUserId)
+                .containsExactlyInAnyOrder(user.getUserId(), other.getUserId());
+        assertThat(notificationRepository.findAllById(List.of(
+                old1.getNotificationId(), old2.getNotificationId(), old3.getNotificationId(), recent.getNotificationId())))
+                .extracting(Notification::getNotificationId)
+                .containsExactlyInAnyOrder(old3.getNotificationId(), recent.getNotificationId());
+    }
+
+    /**
+     * 알림 저장 후 sent_at 지정 (@CreationTimestamp가 INSERT 시 현재 시각으로 덮어쓰므로 UPDATE로 보정)
+     */
+    private Notification save(User receiver, LocalDateTime sentAt, boolean isRead) {
+        Notification notification = em.persistAndFlush(Notification.builder()
+                .user(receiver)
+                .notificationType(NotificationType.SYSTEM)
+                .title("알림")
+                .content("내용")
+                .isRead(isRead)
+                .build());
+
+        em.getEntityManager()
+                .createNativeQuery("UPDATE notifications SET sent_at = :sentAt WHERE notification_id = :id")
+                .setParameter("sentAt", sentAt)
+                .setParameter("id", notification.getNotificationId())
+                .executeUpdate();
+        em.clear();
+        return notification;
+    }
+}
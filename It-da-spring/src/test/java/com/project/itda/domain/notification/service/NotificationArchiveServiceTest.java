@@ -0,0 +1,66 @@
+package com.project.itda.domain.notification.service;
+
+import com.project.itda.domain.notification.repository.NotificationArchiveRepository;
+import com.project.itda.domain.notification.repository.NotificationRepository;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.Test;
+
+import java.time.LocalDateTime;
+import java.util.List;
+
+import static org.assertj.core.api.Assertions.assertThat;
+import static org.assertj.core.api.Assertions.assertThatThrownBy;
+import static org.mockito.ArgumentMatchers.anyList;
+import static org.mockito.Mockito.mock;
+import static org.mockito.Mockito.never;
+import static org.mockito.Mockito.verify;
+import static org.mockito.Mockito.when;
+
+/**
+ * ✅ 오래된 알림 보관 배치 테스트
+ */
+class NotificationArchiveServiceTest {
+
+    private static final LocalDateTime CUTOFF = LocalDateTime.of(2025, 1, 1, 0, 0);
+
+    private NotificationRepository notificationRepository;
+    private NotificationArchiveRepository notificationArchiveRepository;
+    private NotificationArchiveService notificationArchiveService;
+
+    @BeforeEach
+    void setUp() {
+        notificationRepository = mock(NotificationRepository.class);
+        notificationArchiveRepository = mock(NotificationArchiveRepository.class);
+        notificationArchiveService = new NotificationArchiveService(notificationRepository, notificationArchiveRepository);
+    }
+
+    @Test
+    void 대상이_없으면_보관_삭제_안함() {
+        when(notificationRepository.findOldNotificationIdsForUpdate(CUTOFF, 1000)).thenReturn(List.of());
+
+        assertThat(notificationArchiveService.archiveOldBatch(CUTOFF, 1000)).isZero();
+        verify(notificationArchiveRepository, never()).archiveByNotificationIds(anyList());
+        verify(notificationRepository, never()).deleteByNotificationIds(anyList());
+    }
+
+    @Test
+    void 같은_ID목록으로_보관후_삭제() {
+        List<Long> ids = List.of(1L, 2L, 3L);
+        when(notificationRepository.findOldNotificationIdsForUpdate(CUTOFF, 1000)).thenReturn(ids);
+        when(notificationArchiveRepository.archiveByNotificationIds(ids)).thenReturn(3);
+        when(notificationRepository.deleteByNotificationIds(ids)).thenReturn(3);
+
+        assertThat(notificationArchiveService.archiveOldBatch(CUTOFF, 1000)).isEqualTo(3);
+    }
+
+    @Test
+    void 건수가_다르면_예외로_롤백() {
+        List<Long> ids = List.of(1L, 2L);
+        when(notificationRepository.findOldNotificationIdsForUpdate(CUTOFF, 1000)).thenReturn(ids);
+        when(notificationArchiveRepository.archiveByNotificationIds(ids)).thenReturn(1);
+        when(notificationRepository.deleteByNotificationIds(ids)).thenReturn(2);
+
+        assertThatThrownBy(() -> notificationArchiveService.archiveOldBatch(CUTOFF, 1000))
+                .isInstanceOf(IllegalStateException.class);
+    }
+}
@@ -0,0 +1,83 @@
+package com.project.itda.domain.notification.service;
+
+import com.fasterxml.jackson.databind.ObjectMapper;
+import com.project.itda.domain.notification.dto.response.NotificationListResponse;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.Test;
+import org.mockito.InOrder;
+import org.springframework.data.redis.core.HashOperations;
+import org.springframework.data.redis.core.RedisTemplate;
+import org.springframework.data.redis.core.ValueOperations;
+
+import java.util.List;
+
+import static org.mockito.ArgumentMatchers.anyString;
+import static org.mockito.Mockito.inOrder;
+import static org.mockito.Mockito.mock;
+import static org.mockito.Mockito.never;
+import static org.mockito.Mockito.verify;
+import static org.mockito.Mockito.when;
+
+/**
+ * ✅ 알림 목록 캐시 버전 가드 테스트 (조회 중 무효화 시 옛 목록 재캐시 방지)
+ */
+class NotificationCacheServiceTest {
+
+    private static final Long USER_ID = 1L;
+    private static final String LIST_KEY = "notification:list:1";
+    private static final String VERSION_KEY = "notification:list:ver:1";
+
+    private RedisTemplate<String, Object> redisTemplate;
+    private ValueOperations<String, Object> valueOperations;
+    private HashOperations<String, Object, Object> hashOperations;
+    private NotificationCacheService notificationCacheService;
+
+    private final NotificationListResponse response = NotificationListResponse.of(List.of(), 0L, 0, 20, false);
+
+    @BeforeEach
+    @SuppressWarnings("unchecked")
+    void setUp() {
+        redisTemplate = mock(RedisTemplate.class);
+        valueOperations = mock(ValueOperations.class);
+        hashOperations = mock(HashOperations.class);
+        when(redisTemplate.opsForValue()).thenReturn(valueOperations);
+        when(redisTemplate.<Object, Object>opsForHash()).thenReturn(hashOperations);
+        notificationCacheService = new NotificationCacheService(redisTemplate, new ObjectMapper());
+    }
+
+    @Test
+    void 조회중_버전_그대로면_목록_유지() {
+        when(valueOperations.get(VERSION_KEY)).thenReturn(3);
+
+        notificationCacheService.putList(USER_ID, "all", response, 3L);
+
+        verify(hashOperations).put(anyString(), anyString(), anyString());
+        verify(redisTemplate, never()).delete(LIST_KEY);
+    }
+
+    @Test
+    void 조회중_무효화되면_방금_저장한_목록_삭제() {
+        // 조회 전 버전 3 → 저장 시점 4 (그 사이 evictList)
+        when(valueOperations.get(VERSION_KEY)).thenReturn(4);
+
+        notificationCacheService.putList(USER_ID, "all", response, 3L);
+
+        verify(redisTemplate).delete(LIST_KEY);
+    }
+
+    @Test
+    void 버전_조회_실패시_저장_안함() {
+        notificationCacheService.putList(USER_ID, "all", response, -1L);
+
+        verify(hashOperations, never()).put(anyString(), anyString(), anyString());
+    }
+
+    @Test
+    void 무효화는_버전_증가후_키_삭제() {
+        notificationCacheService.evictList(USER_ID);
+
+        InOrder order = inOrder(valueOperations, redisTemplate);
+        order.verify(valueOperations).increment(VERSION_KEY);
+        order.verify(redisTemplate).delete(LIST_KEY);
+    }
+}
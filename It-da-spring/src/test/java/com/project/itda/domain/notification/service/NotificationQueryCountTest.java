@@ -0,0 +1,106 @@
+package com.project.itda.domain.notification.service;
+
+import com.project.itda.domain.notification.dto.response.NotificationListResponse;
+import com.project.itda.domain.notification.entity.Notification;
+import com.project.itda.domain.notification.enums.NotificationType;
+import com.project.itda.domain.notification.repository.NotificationRepository;
+import com.project.itda.domain.social.service.ChatRoomService;
+import com.project.itda.domain.user.entity.User;
+import com.project.itda.domain.user.repository.UserFollowRepository;
+import com.project.itda.domain.user.repository.UserRepository;
+import com.project.itda.domain.user.repository.UserSettingRepository;
+import com.project.itda.global.config.QueryCountInspector;
+import org.junit.jupiter.api.AfterEach;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.Test;
+import org.springframework.beans.factory.annotation.Autowired;
+import org.springframework.boot.test.autoconfigure.jdbc.AutoConfigureTestDatabase;
+import org.springframework.boot.test.autoconfigure.orm.jpa.DataJpaTest;
+import org.springframework.boot.test.autoconfigure.orm.jpa.TestEntityManager;
+import org.springframework.messaging.simp.SimpMessageSendingOperations;
+
+import static org.assertj.core.api.Assertions.assertThat;
+import static org.mockito.Mockito.mock;
+
+/**
+ * ✅ 알림 목록 조회 SQL 횟수 회귀 테스트 (N+1 감지)
+ * - 캐시 miss 상태에서 호출당 2개 이하의 SQL만 실행되어야 함
+ */
+@DataJpaTest(properties = {
+        "spring.datasource.url=jdbc:h2:mem:notification-query-count;MODE=MySQL;DATABASE_TO_LOWER=TRUE;DB_CLOSE_DELAY=-1",
+        "spring.datasource.driver-class-name=org.h2.Driver",
+        "spring.jpa.hibernate.ddl-auto=create-drop",
+        "spring.jpa.properties.hibernate.dialect=org.hibernate.dialect.H2Dialect",
+        "spring.jpa.properties.hibernate.session_factory.statement_inspector=com.project.itda.global.config.QueryCountInspector"
+})
+@AutoConfigureTestDatabase(replace = AutoConfigureTestDatabase.Replace.NONE)
+class NotificationQueryCountTest {
+
+    private static final int MAX_STATEMENTS = 2;
+
+    @Autowired
+    private TestEntityManager em;
+
+    @Autowired
+    private NotificationRepository notificationRepository;
+
+    private NotificationService notificationService;
+    private User user;
+
+    @BeforeEach
+    void setUp() {
+        // 캐시 mock은 항상 null → 매번 DB 조회
+        notificationService = new NotificationService(
+                notificationRepository,
+                mock(UserRepository.class),
+                mock(PushNotificationService.class),
+                mock(UserFollowRepository.class),
+                mock(UserSettingRepository.class),
+                mock(SimpMessageSendingOperations.class),
+                mock(NotificationCacheService.class),
+                mock(NotificationArchiveService.class),
+                mock(ChatRoomService.class)
+        );
+
+        user = em.persist(User.builder().email("user@itda.com").username("user").build());
+        for (int i = 0; i < 30; i++) {
+            em.persist(Notification.builder()
+                    .user(user)
+                    .notificationType(NotificationType.SYSTEM)
+                    .title("알림 " + i)
+                    .content("내용")
+                    .isRead(i % 3 == 0)
+                    .build());
+        }
+        em.flush();
+        // 영속성 컨텍스트 비워서 실제 조회 경로 그대로 측정
+        em.clear();
+    }
+
+    @AfterEach
+    void tearDown() {
+        QueryCountInspector.stop();
+    }
+
+    @Test
+    void getNotifications_첫페이지_SQL_2개_이하() {
+        QueryCountInspector.start();
+        NotificationListResponse response = notificationService.getNotifications(user.getUserId(), 0, 20);
+        int statements = QueryCountInspector.stop();
+
+        assertThat(response.getNotifications()).hasSize(20);
+        assertThat(response.getUnreadCount()).isEqualTo(20L);
+        assertThat(statements).isLessThanOrEqualTo(MAX_STATEMENTS);
+    }
+
+    @Test
+    void getAllNotifications_SQL_2개_이하() {
+        QueryCountInspector.start();
+        NotificationListResponse response = notificationService.getAllNotifications(user.getUserId());
+        int statements = QueryCountInspector.stop();
+
+        assertThat(response.getNotifications()).hasSize(30);
+        assertThat(response.getUnreadCount()).isEqualTo(20L);
+        assertThat(statements).isLessThanOrEqualTo(MAX_STATEMENTS);
+    }
+}
@@ -0,0 +1,172 @@
+package com.project.itda.domain.notification.service;
+
+import com.project.itda.domain.notification.dto.response.NotificationListResponse;
+import com.project.itda.domain.notification.entity.Notification;
+import com.project.itda.domain.notification.enums.NotificationType;
+import com.project.itda.domain.notification.repository.NotificationRepository;
+import com.project.itda.domain.social.service.ChatRoomService;
+import com.project.itda.domain.user.entity.User;
+import com.project.itda.domain.user.repository.UserFollowRepository;
+import com.project.itda.domain.user.repository.UserRepository;
+import com.project.itda.domain.user.repository.UserSettingRepository;
+import org.junit.jupiter.api.BeforeEach;
+import org.junit.jupiter.api.Test;
+import org.mockito.ArgumentCaptor;
+import org.springframework.data.domain.PageRequest;
+import org.springframework.data.domain.SliceImpl;
+import org.springframework.messaging.simp.SimpMessageSendingOperations;
+
+import java.nio.charset.StandardCharsets;
+import java.time.LocalDateTime;
+import java.util.ArrayList;
+import java.util.Arrays;
+import java.util.Base64;
+import java.util.List;
+import java.util.stream.LongStream;
+
+import static org.assertj.core.api.Assertions.assertThat;
+import static org.assertj.core.api.Assertions.assertThatThrownBy;
+import static org.mockito.ArgumentMatchers.any;
+import static org.mockito.ArgumentMatchers.anyList;
+import static org.mockito.ArgumentMatchers.eq;
+import static org.mockito.Mockito.mock;
+import static org.mockito.Mockito.times;
+import static org.mockito.Mockito.verify;
+import static org.mockito.Mockito.verifyNoInteractions;
+import static org.mockito.Mockito.when;
+
+/**
+ * ✅ 알림 서비스 단위 테스트 (커서 페이징, ID 청크, 목록 캐시)
+ */
+class NotificationServiceTest {
+
+    private static final Long USER_ID = 1L;
+    private static final LocalDateTime BASE = LocalDateTime.of(2025, 1, 1, 12, 0, 30);
+
+    private NotificationRepository notificationRepository;
+    private NotificationCacheService notificationCacheService;
+    private NotificationService notificationService;
+
+    private final User user = User.builder().userId(USER_ID).email("user@itda.com").username("user").build();
+
+    @BeforeEach
+    void setUp() {
+        notificationRepository = mock(NotificationRepository.class);
+        notificationCacheService = mock(NotificationCacheService.class);
+        notificationService = new NotificationService(
+                notificationRepository,
+                mock(UserRepository.class),
+                mock(PushNotificationService.class),
+                mock(UserFollowRepository.class),
+                mock(UserSettingRepository.class),
+                mock(SimpMessageSendingOperations.class),
+                notificationCacheService,
+                mock(NotificationArchiveService.class),
+                mock(ChatRoomService.class)
+        );
+    }
+
+    @Test
+    void 첫페이지_nextCursor로_다음페이지_조회() {
+        Notification first = notification(12L, BASE);
+        Notification last = notification(11L, BASE.minusMinutes(5));
+        when(notificationRepository.findSliceWithUnreadCount(eq(USER_ID), any()))
+                .thenReturn(new SliceImpl<>(rows(new Object[]{first, 3L}, new Object[]{last, 3L}),
+                        PageRequest.of(0, 2), true));
+
+        NotificationListResponse page = notificationService.getNotifications(USER_ID, 0, 2);
+
+        assertThat(page.isHasNext()).isTrue();
+        assertThat(page.getNextCursor()).isNotBlank();
+
+        // 커서 = 마지막 행의 (sentAt, notificationId), size + 1개 조회
+        Notification next = notification(10L, BASE.minusMinutes(10));
+        when(notificationRepository.findAfterCursorWithUnreadCount(
+                USER_ID, last.getSentAt(), last.getNotificationId(), PageRequest.of(0, 3)))
+                .thenReturn(rows(new Object[]{next, 3L}));
+
+        NotificationListResponse nextPage = notificationService.getNotificationsByCursor(USER_ID, page.getNextCursor(), 2);
+
+        assertThat(nextPage.getNotifications()).extracting("notificationId").containsExactly(10L);
+        assertThat(nextPage.isHasNext()).isFalse();
+        assertThat(nextPage.getNextCursor()).isNull();
+        assertThat(nextPage.getUnreadCount()).isEqualTo(3L);
+    }
+
+    @Test
+    void 커서조회_size보다_많으면_hasNext() {
+        when(notificationRepository.findAfterCursorWithUnreadCount(eq(USER_ID), any(), any(), eq(PageRequest.of(0, 3))))
+                .thenReturn(rows(
+                        new Object[]{notification(9L, BASE), 1L},
+                        new Object[]{notification(8L, BASE), 1L},
+                        new Object[]{notification(7L, BASE), 1L}));
+
+        NotificationListResponse response = notificationService.getNotificationsByCursor(USER_ID, encode(BASE, 10L), 2);
+
+        assertThat(response.getNotifications()).extracting("notificationId").containsExactly(9L, 8L);
+        assertThat(response.isHasNext()).isTrue();
+        assertThat(response.getNextCursor()).isEqualTo(encode(BASE, 8L));
+    }
+
+    @Test
+    void 잘못된_커서는_IllegalArgumentException() {
+        assertThatThrownBy(() -> notificationService.getNotificationsByCursor(USER_ID, "not-a-cursor", 20))
+                .isInstanceOf(IllegalArgumentException.class);
+    }
+
+    @Test
+    void 일괄_읽음처리는_500개_단위로_나눠_실행() {
+        List<Long> ids = LongStream.rangeClosed(1, 1001).boxed().toList();
+        when(notificationRepository.markAsReadByIds(eq(USER_ID), anyList()))
+                .thenAnswer(invocation -> ((List<?>) invocation.getArgument(1)).size());
+
+        int updated = notificationService.markAsRead(USER_ID, ids);
+
+        @SuppressWarnings("unchecked")
+        ArgumentCaptor<List<Long>> chunks = ArgumentCaptor.forClass(List.class);
+        verify(notificationRepository, times(3)).markAsReadByIds(eq(USER_ID), chunks.capture());
+        assertThat(chunks.getAllValues()).extracting(List::size).containsExactly(500, 500, 1);
+        assertThat(updated).isEqualTo(1001);
+    }
+
+    @Test
+    void 첫페이지_캐시_hit이면_DB조회_안함() {
+        NotificationListResponse cached = NotificationListResponse.of(List.of(), 0L, 0, 20, false);
+        when(notificationCacheService.getList(USER_ID, "page:20")).thenReturn(cached);
+
+        assertThat(notificationService.getNotifications(USER_ID, 0, 20)).isSameAs(cached);
+        verifyNoInteractions(notificationRepository);
+    }
+
+    @Test
+    void 첫페이지_캐시_miss면_조회전_버전으로_조회결과_저장() {
+        when(notificationCacheService.getListVersion(USER_ID)).thenReturn(7L);
+        when(notificationRepository.findSliceWithUnreadCount(eq(USER_ID), any()))
+                .thenReturn(new SliceImpl<>(rows(new Object[]{notification(1L, BASE), 0L}), PageRequest.of(0, 20), false));
+
+        NotificationListResponse response = notificationService.getNotifications(USER_ID, 0, 20);
+
+        verify(notificationCacheService).putList(USER_ID, "page:20", response, 7L);
+    }
+
+    private Notification notification(Long id, LocalDateTime sentAt) {
+        return Notification.builder()
+                .notificationId(id)
+                .user(user)
+                .notificationType(NotificationType.SYSTEM)
+                .title("알림")
+                .content("내용")
+                .sentAt(sentAt)
+                .build();
+    }
+
+    private static List<Object[]> rows(Object[]... rows) {
+        return new ArrayList<>(Arrays.asList(rows));
+    }
+
+    // NotificationService 커서 포맷: base64url("sentAt|notificationId")
+    private static String encode(LocalDateTime sentAt, Long id) {
+        return Base64.getUrlEncoder().withoutPadding()
+                .encodeToString((sentAt + "|" + id).getBytes(StandardCharsets.UTF_8));
+    }
+}
@@ -18,8 +18,10 @@ import math
 import app
 from app.models.model_loader import model_loader
 from app.core.logging import logger
+from app.core.responses import FastJSONResponse
 from app.schemas.ai_schemas import AISearchRequest, AISearchResponse
 from app.core.feature_builder import FeatureBuilder
+from app.core.scoring_utils import percentile_midrank_batch
 from app.services.gpt_prompt_service import GPTPromptService
 from app.services.AIRecommendationService import AIRecommendationService
 import math
@@ -298,19 +300,41 @@ def stretch(p: float, k: float = 1.8) -> float:
 # Dependency Injection
 # ========================================
 
-def get_gpt_service() -> GPTPromptService:
-    """GPT 서비스 의존성"""
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        raise HTTPException(status_code=500, detail="OPENAI_API_KEY not configured")
-    return GPTPromptService(api_key=api_key)
+# 프로세스 단위 싱글톤 (요청마다 OpenAI 클라이언트/서비스 그래프 재생성 방지)
+_gpt_service: Optional[GPTPromptService] = None
+_ai_recommendation_service: Optional[AIRecommendationService] = None
 
-def get_ai_recommendation_service(
+
+async def get_gpt_service() -> GPTPromptService:
+    """GPT 서비스 의존성 (async: 스레드풀 오프로드 없이 인라인 실행)"""
+    global _gpt_service
+    if _gpt_service is None:
+        api_key = os.getenv("OPENAI_API_KEY")
+        if not api_key:
+            raise HTTPException(status_code=500, detail="OPENAI_API_KEY not configured")
+        _gpt_service = GPTPromptService(api_key=api_key)
+    return _gpt_service
+
+async def get_ai_recommendation_service(
     gpt_service: GPTPromptService = Depends(get_gpt_service)
 ) -> AIRecommendationService:
     """AI 추천 서비스 의존성"""
-    spring_boot_url = os.getenv("SPRING_BOOT_URL", "http://localhost:8080")
-    return AIRecommendationService(gpt_service, spring_boot_url)
+    global _ai_recommendation_service
+    if _ai_recommendation_service is None:
+        spring_boot_url = os.getenv("SPRING_BOOT_URL", "http://localhost:8080")
+        _ai_recommendation_service = AIRecommendationService(gpt_service, spring_boot_url)
+    return _ai_recommendation_service
+
+
+async def close_ai_services() -> None:
+    """싱글톤 서비스가 보유한 HTTP 커넥션 정리 (lifespan 종료 시 호출)"""
+    global _ai_recommendation_service, _gpt_service
+    if _ai_recommendation_service is not None:
+        await _ai_recommendation_service.aclose()
+        _ai_recommendation_service = None
+    if _gpt_service is not None:
+        await _gpt_service.aclose()
+        _gpt_service = None
 
 # ========================================
 # API Endpoints
@@ -530,45 +554,38 @@ async def recommend_meetings(user_id: int, top_n: int = 10):
     SVD 협업 필터링 모임 추천
     GET /api/ai/recommendations/meetings?user_id=121&top_n=20
     """
-    try:
-        logger.info(f"🤖 AI 추천 요청: user_id={user_id}, top_n={top_n}")
-
-        if not model_loader.svd or not model_loader.svd.is_loaded():
-            logger.error("❌ SVD 모델이 로드되지 않았습니다")
-            raise HTTPException(status_code=503, detail="SVD 모델이 로드되지 않았습니다")
+    logger.info(f"🤖 AI 추천 요청: user_id={user_id}, top_n={top_n}")
 
-        if top_n > 50:
-            top_n = 50
+    if not model_loader.svd or not model_loader.svd.is_loaded():
+        logger.error("❌ SVD 모델이 로드되지 않았습니다")
+        raise HTTPException(status_code=503, detail="SVD 모델이 로드되지 않았습니다")
 
-        recommendations = await model_loader.svd.recommend(user_id=user_id, top_n=top_n)
-        logger.info(f"✅ SVD 추천 완료: {len(recommendations)}개")
+    if top_n > 50:
+        top_n = 50
 
-        rec_list = [
-            {
-                "meeting_id": int(meeting_id),
-                "score": round(float(score), 4),
-                "rank": idx + 1
-            }
-            for idx, (meeting_id, score) in enumerate(recommendations)
-        ]
+    recommendations = await model_loader.svd.recommend(user_id=user_id, top_n=top_n)
+    logger.info(f"✅ SVD 추천 완료: {len(recommendations)}개")
 
-        return {
-            "success": True,
-            "user_id": user_id,
-            "recommendations": rec_list,
-            "total_count": len(rec_list),
-            "model_info": {
-                "rmse": None,
-                "mae": None,
-                "accuracy": None
-            }
+    rec_list = [
+        {
+            "meeting_id": int(meeting_id),
+            "score": round(float(score), 4),
+            "rank": idx + 1
         }
+        for idx, (meeting_id, score) in enumerate(recommendations)
+    ]
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"❌ 추천 실패: {str(e)}", exc_info=True)
-        raise HTTPException(status_code=500, detail=f"추천 실패: {str(e)}")
+    return {
+        "success": True,
+        "user_id": user_id,
+        "recommendations": rec_list,
+        "total_count": len(rec_list),
+        "model_info": {
+            "rmse": None,
+            "mae": None,
+            "accuracy": None
+        }
+    }
 
 # ========================================
 # 만족도 예측 (GET + POST 둘 다 지원)
@@ -693,16 +710,11 @@ async def analyze_sentiment(request: SentimentRequest):
     KcELECTRA 감성 분석
     POST /api/ai/recommendations/sentiment
     """
-    try:
-        if not model_loader.kcelectra or not model_loader.kcelectra.is_loaded():
-            raise HTTPException(status_code=503, detail="KcELECTRA 모델이 로드되지 않았습니다")
-
-        result = model_loader.kcelectra.predict(request.text)
-        return result
+    if not model_loader.kcelectra or not model_loader.kcelectra.is_loaded():
+        raise HTTPException(status_code=503, detail="KcELECTRA 모델이 로드되지 않았습니다")
 
-    except Exception as e:
-        logger.error(f"감성 분석 실패: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    result = model_loader.kcelectra.predict(request.text)
+    return result
 
 # ========================================
 # 중간지점 계산
@@ -714,26 +726,21 @@ async def calculate_centroid(request: CentroidRequest):
     중간지점 계산
     POST /api/ai/recommendations/centroid
     """
-    try:
-        locations = request.user_locations
+    locations = request.user_locations
 
-        if not locations:
-            raise HTTPException(status_code=400, detail="위치 목록이 비어있습니다")
+    if not locations:
+        raise HTTPException(status_code=400, detail="위치 목록이 비어있습니다")
 
-        avg_lat = sum(loc["latitude"] for loc in locations) / len(locations)
-        avg_lng = sum(loc["longitude"] for loc in locations) / len(locations)
-
-        return {
-            "centroid": {
-                "latitude": round(avg_lat, 6),
-                "longitude": round(avg_lng, 6)
-            },
-            "address": None
-        }
+    avg_lat = sum(loc["latitude"] for loc in locations) / len(locations)
+    avg_lng = sum(loc["longitude"] for loc in locations) / len(locations)
 
-    except Exception as e:
-        logger.error(f"중간지점 계산 실패: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return {
+        "centroid": {
+            "latitude": round(avg_lat, 6),
+            "longitude": round(avg_lng, 6)
+        },
+        "address": None
+    }
 
 # ========================================
 # 장소 추천
@@ -745,29 +752,24 @@ async def recommend_place(request: PlaceRecommendRequest):
     장소 추천 (Kakao Maps 연동 필요)
     POST /api/ai/recommendations/place
     """
-    try:
-        locations = [
-            {"latitude": p["latitude"], "longitude": p["longitude"]}
-            for p in request.participants
-        ]
-
-        avg_lat = sum(loc["latitude"] for loc in locations) / len(locations)
-        avg_lng = sum(loc["longitude"] for loc in locations) / len(locations)
+    locations = [
+        {"latitude": p["latitude"], "longitude": p["longitude"]}
+        for p in request.participants
+    ]
 
-        centroid = {"latitude": round(avg_lat, 6), "longitude": round(avg_lng, 6)}
+    avg_lat = sum(loc["latitude"] for loc in locations) / len(locations)
+    avg_lng = sum(loc["longitude"] for loc in locations) / len(locations)
 
-        return {
-            "success": True,
-            "centroid": centroid,
-            "search_radius": request.max_distance * 1000,
-            "recommendations": [],
-            "filtered_count": {"total": 0, "within_radius": 0, "returned": 0},
-            "processing_time_ms": 0
-        }
+    centroid = {"latitude": round(avg_lat, 6), "longitude": round(avg_lng, 6)}
 
-    except Exception as e:
-        logger.error(f"장소 추천 실패: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    return {
+        "success": True,
+        "centroid": centroid,
+        "search_radius": request.max_distance * 1000,
+        "recommendations": [],
+        "filtered_count": {"total": 0, "within_radius": 0, "returned": 0},
+        "processing_time_ms": 0
+    }
 
 # ========================================
 # AI 검색 (GPT)
@@ -785,32 +787,28 @@ async def ai_search(
     rid = str(uuid.uuid4())[:8]
     logger.info(f"[RID={rid}] 🔍 AI 검색 요청: user_id={request.user_id}, prompt='{request.user_prompt}'")
 
-    print("🔥🔥🔥 /search 엔드포인트 호출됨!")
-    logger.info(f"🔥🔥🔥 /search 엔드포인트 호출!")
-    logger.info(f"[RID={rid}] 🔍 AI 검색 요청: user_id={request.user_id}, prompt='{request.user_prompt}'")
-
-    try:
-        # ✅ 여기도 추가
-        print(f"🔥🔥🔥 ai_service.get_ai_recommendations 호출 직전!")
-        logger.info(f"🔥🔥🔥 ai_service.get_ai_recommendations 호출 직전!")
-
-        result = await ai_service.get_ai_recommendations(
-            user_prompt=request.user_prompt,
-            user_id=request.user_id,
-            top_n=request.top_n
-        )
+    result = await ai_service.get_ai_recommendations(
+        user_prompt=request.user_prompt,
+        user_id=request.user_id,
+        top_n=request.top_n
+    )
 
+    logger.info(f"[RID={rid}] ✅ AI 검색 완료: {len(result['recommendations'])}개 추천")
 
-        logger.info(f"✅ AI 검색 완료: {len(result['recommendations'])}개 추천")
-        # ✅ 완료 후에도
-        print(f"🔥🔥🔥 결과 받음: {len(result.get('recommendations', []))}개")
-        logger.info(f"✅ AI 검색 완료: {len(result['recommendations'])}개 추천")
+    # 스키마로 검증/필터링(search_trace 등 내부 필드 제외) 후 바로 직렬화 (jsonable_encoder 단계 생략)
+    return FastJSONResponse(AISearchResponse.model_validate(result).model_dump(mode="json"))
 
-        return result
+@router.delete("/users/{user_id}/context")
+async def invalidate_user_context(user_id: int):
+    """
+    사용자 컨텍스트 캐시 무효화 (Spring에서 프로필/선호도 수정 후 호출)
+    DELETE /api/ai/recommendations/users/{user_id}/context
+    """
+    # 서비스가 아직 생성되지 않았으면 캐시도 없음 (OpenAI 클라이언트 생성 불필요)
+    if _ai_recommendation_service is not None:
+        _ai_recommendation_service.invalidate_user_context(user_id)
+    return {"user_id": user_id, "invalidated": True}
 
-    except Exception as e:
-        logger.error(f"❌ AI 검색 실패: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/parse-prompt")
 async def parse_prompt(
@@ -821,15 +819,11 @@ async def parse_prompt(
     GPT 프롬프트 파싱 테스트
     GET /api/ai/recommendations/parse-prompt?prompt=오늘 저녁 강남에서 러닝
     """
-    try:
-        parsed = await gpt_service.parse_search_query(prompt)
-        return {
-            "prompt": prompt,
-            "parsed": parsed
-        }
-    except Exception as e:
-        logger.error(f"❌ 프롬프트 파싱 실패: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    parsed = await gpt_service.parse_search_query(prompt)
+    return {
+        "prompt": prompt,
+        "parsed": parsed
+    }
 
 
 # ai_routes.py에 추가할 코드
@@ -876,24 +870,7 @@ async def get_match_scores(req: MatchScoresRequest):
     # 4) 퍼센타일(midrank)
     mids = list(r_used_map.keys())
     r_list = [r_used_map[mid] for mid in mids]
-    sorted_r = sorted(r_list)
-    n = len(sorted_r)
-
-    def p_midrank(x: float) -> float:
-        lt = 0
-        eq = 0
-        for v in sorted_r:
-            if v < x:
-                lt += 1
-            elif v == x:
-                eq += 1
-        p = (lt + 0.5 * eq) / n
-        eps = 0.5 / n
-        if p < eps:
-            p = eps
-        if p > 1 - eps:
-            p = 1 - eps
-        return p
+    p_midrank_map = dict(zip(mids, percentile_midrank_batch(r_list).tolist()))
 
     items = []
 
@@ -914,7 +891,7 @@ async def get_match_scores(req: MatchScoresRequest):
 
         # base score (퍼센타일 기반)
         r_used = r_used_map[mid]
-        p = stretch(p_midrank(r_used), k=1.5)
+        p = stretch(p_midrank_map[mid], k=1.5)
         base_score = match_from_percentile(p, floor=30, ceil=92, gamma=1.4)
 
         # bonus (너가 쓰던 키랑 FeatureBuilder 반환 키가 정확히 매칭됨)
@@ -1,5 +1,7 @@
 # app/core/config.py
 
+from functools import cached_property
+
 from pydantic_settings import BaseSettings
 from pydantic import ConfigDict
 from typing import List, Optional
@@ -20,7 +22,11 @@ class Settings(BaseSettings):
     # =========================
     # CORS
     # =========================
-    ALLOWED_ORIGINS: str = "http://localhost:3000,http://localhost:8080"
+    # 콤마 구분 (main.py CORSMiddleware에서 get_allowed_origins로 사용)
+    ALLOWED_ORIGINS: str = (
+        "http://localhost:3000,http://localhost:5173,http://localhost:8080,"
+        "http://127.0.0.1:3000,http://127.0.0.1:5173,http://127.0.0.1:8080"
+    )
 
     # =========================
     # External APIs
@@ -69,10 +75,10 @@ class Settings(BaseSettings):
         extra="allow"  # ✅ 추가 필드 허용
     )
 
-    @property
+    @cached_property
     def get_allowed_origins(self) -> List[str]:
-        """CORS 허용 출처 리스트 반환"""
-        return [origin.strip() for origin in self.ALLOWED_ORIGINS.split(",")]
+        """CORS 허용 출처 리스트 반환 (최초 1회만 파싱)"""
+        return [origin.strip() for origin in self.ALLOWED_ORIGINS.split(",") if origin.strip()]
 
 
 # 싱글톤 인스턴스
@@ -1,4 +1,4 @@
-from typing import Dict, Tuple, List
+from typing import Dict, Tuple, List, Optional
 import numpy as np
 import math
 import json
@@ -76,6 +76,17 @@ class FeatureBuilder:
         c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
         return R * c
 
+    def haversine_batch(self, lat1: float, lng1: float, lats: np.ndarray, lngs: np.ndarray) -> np.ndarray:
+        """한 점 → 여러 점 거리(km)를 ndarray 연산으로 한 번에 계산 (haversine_distance와 동일 공식)"""
+        R = 6371
+        lat1_r = np.radians(lat1)
+        lats_r = np.radians(lats)
+        dlat = lats_r - lat1_r
+        dlng = np.radians(lngs - lng1)
+        a = np.sin(dlat / 2) ** 2 + np.cos(lat1_r) * np.cos(lats_r) * np.sin(dlng / 2) ** 2
+        c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+        return R * c
+
     def _parse_user_interests(self, user_interests) -> set:
         """입력 형태: JSON string, 콤마/공백 구분"""
         if not user_interests:
@@ -172,15 +183,21 @@ class FeatureBuilder:
         denom = max(float(max_cost), 1.0)
         return max(0.0, 1.0 - (meeting_cost - max_cost) / denom)
 
-    def build_vector(self, user: Dict, meeting: Dict) -> Tuple[Dict, List[float]]:
-        """특징 dict + 1D feature vector(List[float]) 생성"""
+    def build_vector(
+            self,
+            user: Dict,
+            meeting: Dict,
+            distance_km: Optional[float] = None
+    ) -> Tuple[Dict, List[float]]:
+        """특징 dict + 1D feature vector(List[float]) 생성 (distance_km를 주면 거리 계산 생략)"""
 
-        u_lat = float(user.get("lat", 37.5) or 37.5)
-        u_lng = float(user.get("lng", 127.0) or 127.0)
-        m_lat = float(meeting.get("lat", 37.5) or 37.5)
-        m_lng = float(meeting.get("lng", 127.0) or 127.0)
+        if distance_km is None:
+            u_lat = float(user.get("lat", 37.5) or 37.5)
+            u_lng = float(user.get("lng", 127.0) or 127.0)
+            m_lat = float(meeting.get("lat", 37.5) or 37.5)
+            m_lng = float(meeting.get("lng", 127.0) or 127.0)
 
-        distance_km = self.haversine_distance(u_lat, u_lng, m_lat, m_lng)
+            distance_km = self.haversine_distance(u_lat, u_lng, m_lat, m_lng)
 
         time_match = 1.0 if user.get("time_preference") == meeting.get("time_slot") else 0.0
         location_type_match = 1.0 if user.get("user_location_pref") == meeting.get("meeting_location_type") else 0.0
@@ -274,18 +291,58 @@ class FeatureBuilder:
         features, vec = self.build_vector(user, meeting)
         return features, np.asarray([vec], dtype=float)
 
-    def build_batch(self, user: Dict, meetings: List[Dict]) -> Tuple[List[Dict], np.ndarray]:
-        """동일 user + 여러 meeting → (features_list, X[N, n_features])"""
+    def build_batch(
+            self,
+            user: Dict,
+            meetings: List[Dict],
+            skip_errors: bool = False
+    ) -> Tuple[List[Dict], np.ndarray, List[int]]:
+        """
+        동일 user + 여러 meeting → (features_list, X[N, n_features] float32, 사용된 meeting index)
+        - 행렬을 미리 할당해서 채움 (행별 ndarray 생성 + vstack 제거)
+        - skip_errors=True면 실패한 meeting은 건너뜀
+        - 거리는 haversine_batch로 한 번에 계산 (좌표 파싱 실패 행은 build_vector에서 개별 처리)
+        """
+        X = np.empty((len(meetings), self.n_features), dtype=np.float32)
         feats_list: List[Dict] = []
-        vectors: List[List[float]] = []
+        kept: List[int] = []
+
+        distances = self._batch_distances(user, meetings)
 
-        for m in meetings:
-            feats, vec = self.build_vector(user, m)
+        for i, m in enumerate(meetings):
+            d = distances[i]
+            try:
+                feats, vec = self.build_vector(user, m, None if math.isnan(d) else float(d))
+            except Exception:
+                if not skip_errors:
+                    raise
+                continue
+            X[len(kept)] = vec
             feats_list.append(feats)
-            vectors.append(vec)
+            kept.append(i)
+
+        return feats_list, X[:len(kept)], kept
+
+    def _batch_distances(self, user: Dict, meetings: List[Dict]) -> np.ndarray:
+        """user → 각 meeting 거리 배열 (좌표 파싱 실패 시 NaN)"""
+        n = len(meetings)
+        lats = np.full(n, np.nan)
+        lngs = np.full(n, np.nan)
+
+        try:
+            u_lat = float(user.get("lat", 37.5) or 37.5)
+            u_lng = float(user.get("lng", 127.0) or 127.0)
+        except (TypeError, ValueError):
+            return lats
+
+        for i, m in enumerate(meetings):
+            try:
+                lats[i] = float(m.get("lat", 37.5) or 37.5)
+                lngs[i] = float(m.get("lng", 127.0) or 127.0)
+            except (TypeError, ValueError):
+                lats[i] = np.nan
 
-        X = np.asarray(vectors, dtype=float)
-        return feats_list, X
+        return self.haversine_batch(u_lat, u_lng, lats, lngs)
 
     def get_feature_names(self) -> List[str]:
         base_features = [
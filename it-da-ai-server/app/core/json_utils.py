@@ -0,0 +1,31 @@
+# app/core/json_utils.py
+"""
+JSON 직렬화/역직렬화 헬퍼
+orjson이 설치되어 있으면 orjson, 없으면 stdlib json (경고 로그)
+"""
+
+import json
+
+from app.core.logging import logger
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+    logger.warning("⚠️ orjson 미설치 → stdlib json으로 fallback (pip install -r requirements.txt)")
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def dumps(obj) -> bytes:
+    """obj → UTF-8 JSON bytes (한글 이스케이프 없음)"""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode("utf-8")
+
+
+def loads(data):
+    """JSON bytes/str → obj"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
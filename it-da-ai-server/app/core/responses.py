@@ -0,0 +1,16 @@
+# app/core/responses.py
+"""
+JSON Response 클래스 선택
+orjson이 설치되어 있으면 ORJSONResponse, 없으면 stdlib JSONResponse (경고 로그)
+"""
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+from app.core.logging import logger
+
+try:
+    import orjson  # noqa: F401
+    FastJSONResponse = ORJSONResponse
+except ImportError:
+    FastJSONResponse = JSONResponse
+    logger.warning("⚠️ orjson 미설치 → JSONResponse로 fallback (pip install -r requirements.txt)")
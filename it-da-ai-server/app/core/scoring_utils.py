@@ -1,25 +1,40 @@
 # app/core/scoring_utils.py
+from bisect import bisect_left, bisect_right
 from typing import List
 import math
 
+import numpy as np
+
 def clamp(v: float, lo: float, hi: float) -> float:
     return max(lo, min(hi, v))
 
 def percentile_midrank(values_sorted: List[float], x: float) -> float:
     n = len(values_sorted)
-    lt = 0
-    eq = 0
-    for v in values_sorted:
-        if v < x:
-            lt += 1
-        elif v == x:
-            eq += 1
+    # 정렬된 리스트 → 이진 탐색 O(log n)
+    lt = bisect_left(values_sorted, x)
+    eq = bisect_right(values_sorted, x) - lt
     p = (lt + 0.5 * eq) / n
     eps = 0.5 / n
     if p < eps: p = eps
     if p > 1 - eps: p = 1 - eps
     return p
 
+def percentile_midrank_batch(values: List[float]) -> np.ndarray:
+    """
+    전체 값의 midrank 퍼센타일을 한 번에 계산 (O(n log n), 기존 O(n²) 루프 대체)
+    - tie는 중간값, 끝단은 [0.5/n, 1-0.5/n]로 clip
+    """
+    arr = np.asarray(values, dtype=np.float64)
+    n = arr.size
+    if n == 0:
+        return arr
+    sorted_arr = np.sort(arr)
+    lt = np.searchsorted(sorted_arr, arr, side="left")
+    le = np.searchsorted(sorted_arr, arr, side="right")
+    p = (lt + 0.5 * (le - lt)) / n
+    eps = 0.5 / n
+    return np.clip(p, eps, 1 - eps)
+
 def stretch(p: float, k: float = 2.2) -> float:
     return max(0.0, min(1.0, 0.5 + (p - 0.5) * k))
 
@@ -45,7 +45,10 @@ class LightGBMRankerModel:
         warnings.filterwarnings('ignore')
 
     def load(self):
-        """모델 로드"""
+        """모델 로드 (이미 로드된 경우 재언피클 생략)"""
+        if self.model is not None:
+            return
+
         if not self.model_path.exists():
             raise FileNotFoundError(f"Model not found: {self.model_path}")
 
@@ -77,9 +80,9 @@ class LightGBMRankerModel:
             self.model_type = "direct_model"
             print(f"  ✅ 직접 모델 로드")
 
-        # verbose 설정
+        # verbose 설정 + 요청당 단일 스레드 예측 (동시 요청 시 스레드 과다 방지)
         if hasattr(self.model, 'set_params'):
-            self.model.set_params(verbose=-1)
+            self.model.set_params(verbose=-1, n_jobs=1)
 
         # calibration 로드
         if self.calib_path and self.calib_path.exists():
@@ -101,6 +104,9 @@ class LightGBMRankerModel:
         if self.scaler is not None:
             X = self.scaler.transform(X)
 
+        # LightGBM 내부 변환/복사 방지: C-contiguous float32
+        X = np.ascontiguousarray(X, dtype=np.float32)
+
         # ⭐ stdout 리다이렉션으로 경고 차단
         with suppress_stdout_stderr():
             predictions = self.model.predict(X)
@@ -40,6 +40,10 @@ class LightGBMRegressorModel:
         warnings.filterwarnings('ignore', message='.*num_leaves.*')
 
     def load(self):
+        # 이미 로드된 경우 재언피클 생략
+        if self.model is not None:
+            return
+
         if not self.model_path.exists():
             raise FileNotFoundError(f"Model not found: {self.model_path}")
 
@@ -59,9 +63,9 @@ class LightGBMRegressorModel:
         else:
             raise ValueError(f"지원하지 않는 모델 포맷: {type(obj)}")
 
-        # ⭐ 로드 후 verbose 설정
+        # ⭐ 로드 후 verbose 설정 + 요청당 단일 스레드 예측
         if hasattr(self.model, 'set_params'):
-            self.model.set_params(verbose=-1)
+            self.model.set_params(verbose=-1, n_jobs=1)
 
         print(f"✅ LightGBM Regressor 로드 완료: {self.model_path} (타입: {self.model_type})")
 
@@ -93,6 +97,9 @@ class LightGBMRegressorModel:
         if self.scaler is not None:
             X = self.scaler.transform(X)
 
+        # LightGBM 내부 변환/복사 방지: C-contiguous float32
+        X = np.ascontiguousarray(X, dtype=np.float32)
+
         # ⭐ stderr 리다이렉션으로 C++ 레벨 경고 차단
         with suppress_lightgbm_warnings():
             return self.model.predict(X)
\ No newline at end of file
@@ -48,7 +48,11 @@ class ModelLoader:
         self._initialized = True
 
     def load_all(self):
-        """모든 모델 로드"""
+        """모든 모델 로드 (프로세스당 1회, 이미 준비된 경우 생략)"""
+        if self.is_ready():
+            print("✅ AI 모델 이미 로드됨 - 재로딩 생략")
+            return
+
         print("=" * 70)
         print("🚀 AI 모델 로딩 시작")
         print("=" * 70)
@@ -3,11 +3,16 @@ AI Recommendation Service (통합 오케스트레이터)
 GPT 파싱 → DB 검색 → AI 모델 추천 통합
 """
 
+import asyncio
 import httpx
+import time
 import uuid
-from typing import List, Dict, Optional
+from collections import OrderedDict
+from typing import List, Dict, Optional, Tuple
 
 from app.core.logging import logger
+from app.core import json_utils
+from app.core.keyword_utils import compile_keyword_pattern
 from app.services.gpt_prompt_service import GPTPromptService
 from app.models.model_loader import model_loader
 
@@ -41,6 +46,21 @@ class AIRecommendationService:
         "body_part": ["발가락", "손가락", "머리카락", "무릎"],  # 신체 부위 (활동 무관)
     }
 
+    # 감정/활동/통증 키워드 정규식 (클래스 로드 시 1회 컴파일)
+    _PERSONAL_EMOTION_RES = {
+        category: compile_keyword_pattern(keywords)
+        for category, keywords in PERSONAL_EMOTIONS.items()
+    }
+    _ACTIVITY_RE = compile_keyword_pattern([
+        "모임", "만나", "같이", "함께", "할래", "하고싶",
+        "추천", "찾아", "해줘", "있을까"
+    ])
+    _BODY_PAIN_RE = compile_keyword_pattern(["아파", "아픈", "통증", "쑤셔", "저려"])
+
+    # 사용자 컨텍스트 캐시 TTL (초) / 최대 사용자 수
+    _CTX_TTL = 60.0
+    _CTX_CACHE_SIZE = 1024
+
     def __init__(
         self,
         gpt_service: GPTPromptService,
@@ -54,6 +74,15 @@ class AIRecommendationService:
         self.gpt_service = gpt_service
         self.spring_boot_url = spring_boot_url
 
+        # Spring 호출 공용 클라이언트 (커넥션 풀/keep-alive 재사용)
+        self.http_client = httpx.AsyncClient(
+            timeout=10.0,
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+        )
+
+        # user_id → (조회 시각, 컨텍스트), 저장 순서 = 조회 시각 순 (앞쪽부터 만료)
+        self._ctx_cache: "OrderedDict[int, Tuple[float, Dict]]" = OrderedDict()
+
         # Query 모듈
         self.normalizer = QueryNormalizer()
         self.postprocessor = QueryPostProcessor(self.normalizer)
@@ -65,7 +94,8 @@ class AIRecommendationService:
             spring_boot_url=spring_boot_url,
             query_builder=self.query_builder,
             search_strategy=self.search_strategy,
-            normalizer=self.normalizer
+            normalizer=self.normalizer,
+            http_client=self.http_client
         )
 
         # Scoring 모듈
@@ -80,7 +110,8 @@ class AIRecommendationService:
         # Fallback 모듈
         self.svd_recommender = SVDRecommender(
             model_loader=model_loader,
-            spring_boot_url=spring_boot_url
+            spring_boot_url=spring_boot_url,
+            http_client=self.http_client
         )
         self.reasoning_generator = ReasoningGenerator(gpt_service)
 
@@ -109,9 +140,12 @@ class AIRecommendationService:
 
         try:
             # ==========================================
-            # Step 1: GPT 파싱
+            # Step 1~2: GPT 파싱 + 사용자 컨텍스트 조회 (서로 독립 → 동시 실행)
             # ==========================================
-            parsed_query = await self.gpt_service.parse_search_query(user_prompt)
+            parsed_query, user_context = await asyncio.gather(
+                self.gpt_service.parse_search_query(user_prompt),
+                self._get_user_context(user_id),
+            )
 
             # Taxonomy 교정
             parsed_query = self.normalizer.normalize_taxonomy(parsed_query)
@@ -128,10 +162,6 @@ class AIRecommendationService:
             # Vibe 정규화
             parsed_query["vibe"] = self.normalizer.normalize_vibe(parsed_query.get("vibe"))
 
-            # ==========================================
-            # Step 2: 사용자 컨텍스트 조회
-            # ==========================================
-            user_context = await self._get_user_context(user_id)
             logger.info(f"[CTX] lat={user_context.get('latitude')} lng={user_context.get('longitude')}")
 
             # ==========================================
@@ -291,13 +321,17 @@ class AIRecommendationService:
             # ==========================================
             # Step 8: Reasoning 생성
             # ==========================================
-            for rec in top_recommendations:
-                if (not parsed_query.get("keywords")) or parsed_query.get("confidence", 0) < 0.6:
+            if (not parsed_query.get("keywords")) or parsed_query.get("confidence", 0) < 0.6:
+                for rec in top_recommendations:
                     rec["reasoning"] = self.reasoning_generator.fallback_reasoning(rec, parsed_query)
-                else:
-                    rec["reasoning"] = await self.reasoning_generator.generate(
-                        user_context, rec, parsed_query
-                    )
+            else:
+                # 추천별 GPT 호출은 서로 독립 → 동시 실행 (N×RTT → 1×RTT)
+                reasonings = await asyncio.gather(*[
+                    self.reasoning_generator.generate(user_context, rec, parsed_query)
+                    for rec in top_recommendations
+                ])
+                for rec, reasoning in zip(top_recommendations, reasonings):
+                    rec["reasoning"] = reasoning
 
             logger.info("🏁 TOP=%s", [
                 (r.get("meeting_id"), r.get("title"), r.get("category"), r.get("subcategory"))
@@ -328,17 +362,48 @@ class AIRecommendationService:
     # Helper Methods
     # ==========================================
 
+    async def aclose(self) -> None:
+        """공용 HTTP 클라이언트 종료 (서버 shutdown 시 호출)"""
+        await self.http_client.aclose()
+
+    def invalidate_user_context(self, user_id: Optional[int] = None) -> None:
+        """사용자 컨텍스트 캐시 무효화 (user_id 없으면 전체)"""
+        if user_id is None:
+            self._ctx_cache.clear()
+        else:
+            self._ctx_cache.pop(user_id, None)
+
+    def _put_user_context(self, user_id: int, ctx: Dict) -> None:
+        """컨텍스트 캐시 저장 (만료 항목 정리 + 최대 크기 초과 시 가장 오래된 항목 제거)"""
+        now = time.monotonic()
+        self._ctx_cache[user_id] = (now, ctx)
+        self._ctx_cache.move_to_end(user_id)
+
+        while self._ctx_cache:
+            fetched_at, _ = next(iter(self._ctx_cache.values()))
+            if now - fetched_at < self._CTX_TTL and len(self._ctx_cache) <= self._CTX_CACHE_SIZE:
+                break
+            self._ctx_cache.popitem(last=False)
+
     async def _get_user_context(self, user_id: int) -> Dict:
-        """사용자 컨텍스트 조회"""
+        """사용자 컨텍스트 조회 (TTL 캐시, 실패 시 fallback은 캐시하지 않음)"""
+        hit = self._ctx_cache.get(user_id)
+        if hit:
+            if time.monotonic() - hit[0] < self._CTX_TTL:
+                return hit[1]
+            del self._ctx_cache[user_id]
+
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(f"{self.spring_boot_url}/api/users/{user_id}/context")
-                response.raise_for_status()
-                ctx = response.json()
-                logger.info(f"✅ 사용자 컨텍스트 조회 성공: userId={user_id}")
-                return ctx
+            response = await self.http_client.get(f"{self.spring_boot_url}/api/users/{user_id}/context")
+            response.raise_for_status()
+            ctx = json_utils.loads(response.content)
+            logger.info(f"✅ 사용자 컨텍스트 조회 성공: userId={user_id}")
+            self._put_user_context(user_id, ctx)
+            return ctx
         except Exception as e:
             logger.error(f"❌ 사용자 컨텍스트 조회 실패: {e}")
+            # 조회 중 다른 요청이 넣은 항목도 버림 → 다음 요청은 Spring에서 다시 조회
+            self.invalidate_user_context(user_id)
             return {
                 "user_id": user_id,
                 "latitude": 37.5665,
@@ -357,26 +422,16 @@ class AIRecommendationService:
         text = user_prompt.lower()
         conf = float(parsed_query.get("confidence", 0) or 0)
 
-        # 1) 개인 감정 키워드 체크
-        for category, keywords in self.PERSONAL_EMOTIONS.items():
-            if any(kw in text for kw in keywords):
-                # 활동 키워드가 함께 있으면 OK
-                activity_keywords = [
-                    "모임", "만나", "같이", "함께", "할래", "하고싶",
-                    "추천", "찾아", "해줘", "있을까"
-                ]
-                has_activity = any(ak in text for ak in activity_keywords)
-
-                if not has_activity:
-                    logger.info(f"[PERSONAL_EMOTION] {category} 감지: '{text}'")
-                    return True
+        # 1) 개인 감정 키워드 체크 (활동 키워드가 함께 있으면 OK)
+        for category, pattern in self._PERSONAL_EMOTION_RES.items():
+            if pattern.search(text):
+                if self._ACTIVITY_RE.search(text):
+                    break
+                logger.info(f"[PERSONAL_EMOTION] {category} 감지: '{text}'")
+                return True
 
         # 2) 신체 부위 + 통증 (활동 무관)
-        body_pain = ["아파", "아픈", "통증", "쑤셔", "저려"]
-        has_body_part = any(bp in text for bp in self.PERSONAL_EMOTIONS["body_part"])
-        has_pain = any(p in text for p in body_pain)
-
-        if has_body_part and has_pain:
+        if self._PERSONAL_EMOTION_RES["body_part"].search(text) and self._BODY_PAIN_RE.search(text):
             # "등산 후 발가락 아픔" 같은 건 OK
             if "후" not in text and "때문" not in text:
                 return True
@@ -3,12 +3,40 @@ Reasoning Generator
 GPT 기반 추천 이유 생성
 """
 
-import anyio
 import random
-from typing import Dict
+from typing import Dict, Tuple
 from app.core.logging import logger
 
 
+# fallback reasoning 템플릿 (카테고리별, str.format 플레이스홀더)
+_FALLBACK_TEMPLATES: Dict[str, Tuple[str, ...]] = {
+    "카페": (
+        "조용한 {location}에서 힐링 타임 어때요? ☕ {distance:.1f}km 거리라 부담 없이 다녀올 수 있어요!",
+        "카페에서 브런치 먹으면서 여유롭게 쉬는 건 어떨까요? 현재 {participants}명이 참여 중이라 편안한 분위기예요.",
+    ),
+    "스포츠": (
+        "가볍게 몸 풀면서 스트레스 날려버리기 좋아요! 🏃 {location}에서 함께 운동하면 더 재밌어요.",
+        "적당히 땀 흘리면서 기분전환하기 딱! {participants}명이랑 같이 하면 동기부여도 되고요.",
+    ),
+    "맛집": (
+        "맛있는 거 먹으면서 힐링하는 게 최고죠! 🍽️ {subcategory} 좋아하시면 강추예요.",
+        "{cost:,}원으로 맛있는 음식 먹으면서 스트레스 풀 수 있어요!",
+    ),
+    "문화예술": (
+        "감성 충전이 필요할 때! 🎨 {location}에서 여유롭게 예술 감상하면 마음이 편안해져요.",
+        "조용히 전시 보면서 머리 비우기 딱 좋은 모임이에요. {distance:.1f}km 거리라 가깝고요.",
+    ),
+    "소셜": (
+        "가볍게 놀면서 기분전환! 🎮 {subcategory} 하면서 웃다 보면 스트레스가 확 풀려요.",
+        "{participants}명이랑 함께하는 {subcategory} 모임! 부담 없이 즐기기 좋아요.",
+    ),
+}
+
+_DEFAULT_TEMPLATES: Tuple[str, ...] = (
+    "이 모임은 당신의 취향과 잘 맞을 것 같아요! 😊 {location}에서 {distance:.1f}km 거리예요.",
+)
+
+
 class ReasoningGenerator:
     """추천 이유 생성"""
 
@@ -78,18 +106,15 @@ class ReasoningGenerator:
 **이제 작성하세요 (추천 이유만, 다른 말 없이):**
 """
 
-            def _call():
-                return self.gpt_service.client.chat.completions.create(
-                    model="gpt-4o-mini",
-                    messages=[
-                        {"role": "system", "content": "당신은 공감 능력이 뛰어난 AI 추천 어시스턴트입니다."},
-                        {"role": "user", "content": prompt}
-                    ],
-                    temperature=0.7,
-                    max_tokens=200
-                )
-
-            response = await anyio.to_thread.run_sync(_call)
+            response = await self.gpt_service.aclient.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[
+                    {"role": "system", "content": "당신은 공감 능력이 뛰어난 AI 추천 어시스턴트입니다."},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.7,
+                max_tokens=200
+            )
             reasoning = response.choices[0].message.content.strip()
 
             logger.info(f"✅ GPT reasoning 생성: {reasoning[:50]}...")
@@ -101,38 +126,13 @@ class ReasoningGenerator:
 
     def fallback_reasoning(self, meeting: Dict, parsed_query: Dict) -> str:
         """GPT 실패 시 템플릿 기반 reasoning"""
-        category = meeting.get("category") or ""
-        subcategory = meeting.get("subcategory") or ""
-        location = meeting.get("location_name") or "미정"
-        distance = meeting.get("distance_km") if meeting.get("distance_km") is not None else 0
-        cost = meeting.get("expected_cost") if meeting.get("expected_cost") is not None else 0
-        participants = meeting.get("current_participants") if meeting.get("current_participants") is not None else 0
-
-        templates = {
-            "카페": [
-                f"조용한 {location}에서 힐링 타임 어때요? ☕ {distance:.1f}km 거리라 부담 없이 다녀올 수 있어요!",
-                f"카페에서 브런치 먹으면서 여유롭게 쉬는 건 어떨까요? 현재 {participants}명이 참여 중이라 편안한 분위기예요.",
-            ],
-            "스포츠": [
-                f"가볍게 몸 풀면서 스트레스 날려버리기 좋아요! 🏃 {location}에서 함께 운동하면 더 재밌어요.",
-                f"적당히 땀 흘리면서 기분전환하기 딱! {participants}명이랑 같이 하면 동기부여도 되고요.",
-            ],
-            "맛집": [
-                f"맛있는 거 먹으면서 힐링하는 게 최고죠! 🍽️ {subcategory} 좋아하시면 강추예요.",
-                f"{cost:,}원으로 맛있는 음식 먹으면서 스트레스 풀 수 있어요!",
-            ],
-            "문화예술": [
-                f"감성 충전이 필요할 때! 🎨 {location}에서 여유롭게 예술 감상하면 마음이 편안해져요.",
-                f"조용히 전시 보면서 머리 비우기 딱 좋은 모임이에요. {distance:.1f}km 거리라 가깝고요.",
-            ],
-            "소셜": [
-                f"가볍게 놀면서 기분전환! 🎮 {subcategory} 하면서 웃다 보면 스트레스가 확 풀려요.",
-                f"{participants}명이랑 함께하는 {subcategory} 모임! 부담 없이 즐기기 좋아요.",
-            ],
-        }
-
-        options = templates.get(
-            category,
-            [f"이 모임은 당신의 취향과 잘 맞을 것 같아요! 😊 {location}에서 {distance:.1f}km 거리예요."]
+        template = random.choice(_FALLBACK_TEMPLATES.get(meeting.get("category") or "", _DEFAULT_TEMPLATES))
+
+        # 선택된 템플릿 하나만 포맷
+        return template.format(
+            location=meeting.get("location_name") or "미정",
+            subcategory=meeting.get("subcategory") or "",
+            distance=meeting.get("distance_km") if meeting.get("distance_km") is not None else 0,
+            cost=meeting.get("expected_cost") if meeting.get("expected_cost") is not None else 0,
+            participants=meeting.get("current_participants") if meeting.get("current_participants") is not None else 0,
         )
-        return random.choice(options)
\ No newline at end of file
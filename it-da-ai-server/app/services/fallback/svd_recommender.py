@@ -4,21 +4,24 @@ SVD Recommender
 """
 
 import httpx
-from typing import List, Dict
+from typing import List, Dict, Optional
 from app.core.logging import logger
+from app.core import json_utils
 
 
 class SVDRecommender:
     """SVD 협업 필터링 기반 추천"""
 
-    def __init__(self, model_loader, spring_boot_url: str):
+    def __init__(self, model_loader, spring_boot_url: str, http_client: Optional[httpx.AsyncClient] = None):
         """
         Args:
             model_loader: ModelLoader 인스턴스
             spring_boot_url: Spring Boot API URL
+            http_client: 공용 httpx 클라이언트 (없으면 자체 생성)
         """
         self.model_loader = model_loader
         self.spring_boot_url = spring_boot_url
+        self.http_client = http_client or httpx.AsyncClient(timeout=10.0)
 
     async def recommend(
             self,
@@ -87,13 +90,13 @@ class SVDRecommender:
     async def _get_meetings_by_ids(self, meeting_ids: List[int]) -> List[Dict]:
         """모임 정보 배치 조회"""
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(
-                    f"{self.spring_boot_url}/api/meetings/batch",
-                    json={"meetingIds": meeting_ids}
-                )
+            response = await self.http_client.post(
+                f"{self.spring_boot_url}/api/meetings/batch",
+                content=json_utils.dumps({"meetingIds": meeting_ids}),
+                headers=json_utils.JSON_HEADERS
+            )
             if response.status_code == 200:
-                return response.json().get("meetings", [])
+                return json_utils.loads(response.content).get("meetings", [])
             return []
         except Exception as e:
             logger.error(f"⚠️ 모임 정보 조회 실패: {e}")
@@ -4,7 +4,10 @@ GPT Prompt Parsing Service (FIXED - 실내/실외 구분 강화)
 """
 
 import openai
+import copy
+import hashlib
 import json
+from collections import OrderedDict
 from typing import Dict, List, Optional
 from app.core.logging import logger
 
@@ -12,10 +15,21 @@ from app.core.logging import logger
 class GPTPromptService:
     """GPT를 활용한 프롬프트 파싱 서비스"""
 
+    # 파싱 결과 LRU 캐시 최대 개수
+    PARSE_CACHE_SIZE = 1024
+
     def __init__(self, api_key: str):
-        self.client = openai.OpenAI(api_key=api_key)
+        # 비동기 클라이언트 (GPT 왕복 동안 이벤트 루프를 막지 않음)
+        self.aclient = openai.AsyncOpenAI(api_key=api_key)
         self.model = "gpt-4o-mini"  # 빠르고 저렴한 모델
 
+        # 프롬프트 해시 → GPT 파싱 결과 (성공 결과만 저장)
+        self._parse_cache: "OrderedDict[str, Dict]" = OrderedDict()
+
+    async def aclose(self) -> None:
+        """OpenAI 클라이언트 커넥션 정리"""
+        await self.aclient.close()
+
     async def parse_search_query(self, user_prompt: str) -> Dict:
         """
         사용자 프롬프트를 구조화된 검색 파라미터로 변환
@@ -33,10 +47,18 @@ class GPTPromptService:
             }
         """
 
+        cache_key = self._parse_cache_key(user_prompt)
+        cached = self._parse_cache.get(cache_key)
+        if cached is not None:
+            self._parse_cache.move_to_end(cache_key)
+            logger.info(f"⚡ GPT 파싱 캐시 hit: {user_prompt}")
+            # 호출 측에서 결과를 수정하므로 복사본 반환
+            return copy.deepcopy(cached)
+
         try:
             system_prompt = self._build_system_prompt()
 
-            response = self.client.chat.completions.create(
+            response = await self.aclient.chat.completions.create(
                 model=self.model,
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -63,6 +85,11 @@ class GPTPromptService:
             parsed_data = self._post_fix_ambiguous_ball_play(user_prompt, parsed_data)
 
             logger.info(f"✅ GPT 파싱 성공: {user_prompt} → {parsed_data}")
+
+            self._parse_cache[cache_key] = copy.deepcopy(parsed_data)
+            if len(self._parse_cache) > self.PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+
             return parsed_data
 
         except json.JSONDecodeError as e:
@@ -72,6 +99,12 @@ class GPTPromptService:
             logger.error(f"❌ GPT API 호출 실패: {e}")
             return self._fallback_parse(user_prompt)
 
+    @staticmethod
+    def _parse_cache_key(user_prompt: str) -> str:
+        """정규화된 프롬프트 해시 (캐시 키)"""
+        normalized = (user_prompt or "").strip().lower()
+        return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).hexdigest()
+
     def _build_system_prompt(self) -> str:
         return """당신은 모임 검색 쿼리 파서입니다.
 
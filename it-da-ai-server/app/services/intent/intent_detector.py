@@ -4,6 +4,17 @@ Intent Detector
 """
 
 from app.core.logging import logger
+from app.core.keyword_utils import compile_keyword_pattern
+
+# 모듈 로드 시 1회만 컴파일
+_INTENSE_RE = compile_keyword_pattern(["격정", "격렬", "열정", "강렬", "익스트림", "하드"])
+_BRAIN_RE = compile_keyword_pattern(["머리", "머리쓰", "두뇌", "추리", "전략", "퍼즐", "퀴즈", "방탈출", "보드게임", "체스"])
+_QUIET_RE = compile_keyword_pattern(["조용", "쉬", "힐링", "편하게", "여유", "차분", "편안"])
+_ACTIVE_RE = compile_keyword_pattern(["러닝", "운동", "뛰", "배드민턴", "축구", "클라이밍"])
+_HANDS_RE = compile_keyword_pattern(["손으로", "공방", "diy", "만들기", "수공예", "캘리", "붓글씨", "그림", "도예"])
+
+_ACTIVE_VIBES = frozenset({"격렬한", "활기찬", "에너지", "즐거운"})
+_QUIET_VIBES = frozenset({"편안한", "여유로운", "조용한"})
 
 
 class IntentDetector:
@@ -23,38 +34,33 @@ class IntentDetector:
         t = (user_prompt or "").lower()
 
         # 1순위: 격렬함 키워드
-        intense_keywords = ["격정", "격렬", "열정", "강렬", "익스트림", "하드"]
-        if any(k in t for k in intense_keywords):
+        if _INTENSE_RE.search(t):
             logger.info(f"[INTENT] ACTIVE 감지 (격렬함)")
             return "ACTIVE"
 
         # 2순위: 뇌/추리
-        brain_words = ["머리", "머리쓰", "두뇌", "추리", "전략", "퍼즐", "퀴즈", "방탈출", "보드게임", "체스"]
-        if any(w in t for w in brain_words):
+        if _BRAIN_RE.search(t):
             logger.info(f"[INTENT] BRAIN 감지")
             return "BRAIN"
 
         # 3순위: vibe 기반
         vibe = parsed_query.get("vibe", "")
-        if vibe in ["격렬한", "활기찬", "에너지", "즐거운"]:
+        if vibe in _ACTIVE_VIBES:
             logger.info(f"[INTENT] ACTIVE 감지 (vibe={vibe})")
             return "ACTIVE"
 
         # 4순위: 조용함
-        quiet_words = ["조용", "쉬", "힐링", "편하게", "여유", "차분", "편안"]
-        if any(w in t for w in quiet_words) or vibe in ["편안한", "여유로운", "조용한"]:
+        if _QUIET_RE.search(t) or vibe in _QUIET_VIBES:
             logger.info(f"[INTENT] QUIET 감지")
             return "QUIET"
 
         # 5순위: 활동성
-        active_words = ["러닝", "운동", "뛰", "배드민턴", "축구", "클라이밍"]
-        if any(w in t for w in active_words):
+        if _ACTIVE_RE.search(t):
             logger.info(f"[INTENT] ACTIVE 감지 (활동)")
             return "ACTIVE"
 
         # 6순위: 손으로 만들기
-        hands_words = ["손으로", "공방", "diy", "만들기", "수공예", "캘리", "붓글씨", "그림", "도예"]
-        if any(w in t for w in hands_words):
+        if _HANDS_RE.search(t):
             logger.info(f"[INTENT] HANDS_ON 감지")
             return "HANDS_ON"
 
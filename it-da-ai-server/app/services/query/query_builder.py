@@ -5,12 +5,21 @@ Spring Boot 검색 API용 payload 생성
 
 from typing import Optional
 from app.core.logging import logger
-from app.core.keyword_utils import clean_keywords  # ✅ 임포트 추가
+from app.core.keyword_utils import clean_keywords, compile_keyword_pattern
+
+# 명시적 시간대 표현 (모듈 로드 시 1회 컴파일)
+_EXPLICIT_TIMESLOT_RE = compile_keyword_pattern([
+    "아침", "오전", "점심", "오후", "저녁", "밤", "야간",
+    "morning", "afternoon", "evening", "night"
+])
 
 
 class QueryBuilder:
     """Spring Boot 검색 요청 payload 생성"""
 
+    # Spring AISearchService 기본값 (같은 값이면 payload에서 생략)
+    DEFAULT_RADIUS_KM = 10.0
+
     def __init__(self, normalizer):
         """
         Args:
@@ -89,9 +98,10 @@ class QueryBuilder:
 
         logger.info(f"[PAYLOAD_DEBUG] category={payload.get('category')} subcategory={payload.get('subcategory')} vibe={payload.get('vibe')}")
 
-        # 10) radius는 근처 의도일 때만
-        if near_me:
-            payload["radius"] = float(enriched_query.get("radius") or 10.0)
+        # 10) radius는 근처 의도 + Spring 기본값(10km)과 다를 때만
+        radius = enriched_query.get("radius")
+        if near_me and radius and float(radius) != self.DEFAULT_RADIUS_KM:
+            payload["radius"] = float(radius)
 
         # 로그
         logger.info(
@@ -112,19 +122,17 @@ class QueryBuilder:
 
     def _has_explicit_timeslot(self, text: str) -> bool:
         """명시적 시간대 표현 감지"""
-        t = (text or "").lower()
-        return any(k in t for k in [
-            "아침", "오전", "점심", "오후", "저녁", "밤", "야간",
-            "morning", "afternoon", "evening", "night"
-        ])
+        return bool(_EXPLICIT_TIMESLOT_RE.search((text or "").lower()))
 
     def _clean_payload(self, payload: dict) -> dict:
         """null/""/[] 값 제거"""
 
         def clean(o):
             if isinstance(o, dict):
-                return {k: clean(v) for k, v in o.items()
-                        if v is not None and v != "" and v != []}
+                cleaned = {k: clean(v) for k, v in o.items()}
+                # 하위 값이 모두 빠져 빈 dict가 된 경우(userLocation 좌표 없음 등)도 제거
+                return {k: v for k, v in cleaned.items()
+                        if v is not None and v != "" and v != [] and v != {}}
             return o
 
         return clean(payload)
\ No newline at end of file
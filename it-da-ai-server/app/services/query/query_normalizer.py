@@ -46,6 +46,65 @@ class QueryNormalizer:
         "당구": "소셜", "노래방": "소셜", "와인바": "소셜",
     }
 
+    # 시간대 → Spring Enum (소문자 키)
+    TIMESLOT_MAP = {
+        "morning": "MORNING",
+        "afternoon": "AFTERNOON",
+        "evening": "EVENING",
+        "night": "NIGHT",
+        "오전": "MORNING",
+        "아침": "MORNING",
+        "점심": "AFTERNOON",
+        "오후": "AFTERNOON",
+        "저녁": "EVENING",
+        "밤": "NIGHT",
+        "야간": "NIGHT",
+    }
+
+    # 분위기 → 표준 vibe (부분 포함 매칭, 순서 유지)
+    VIBE_MAP = {
+        # 즐거운 계열
+        "신나는": "즐거운",
+        "재밌는": "즐거운",
+        "즐거운": "즐거운",
+
+        # 활기찬 계열
+        "활기찬": "활기찬",
+        "에너지": "활기찬",
+        "에너지넘치는": "활기찬",
+
+        # 여유로운 계열
+        "편안한": "여유로운",
+        "여유로운": "여유로운",
+        "차분한": "여유로운",
+        "조용한": "여유로운",
+
+        # 기타
+        "힐링": "힐링",
+        "감성": "감성적인",
+        "감성적인": "감성적인",
+        "배움": "배움",
+        "진지한": "진지한",
+        "건강한": "건강한",
+    }
+
+    # 장소 타입 → Spring Enum (소문자 키)
+    LOCATION_TYPE_MAP = {
+        "indoor": "INDOOR",
+        "outdoor": "OUTDOOR",
+        "실내": "INDOOR",
+        "실외": "OUTDOOR",
+        "야외": "OUTDOOR",
+    }
+
+    # 예산 타입 → 모델 입력
+    BUDGET_TYPE_MAP = {
+        "VALUE": "value", "value": "value",
+        "가성비": "value", "합리": "value",
+        "QUALITY": "quality", "quality": "quality",
+        "품질": "quality",
+    }
+
     def normalize_timeslot(self, ts: Optional[str]) -> Optional[str]:
         """시간대를 Spring Enum 형식으로 정규화"""
         if not ts:
@@ -58,21 +117,7 @@ class QueryNormalizer:
             raw = raw.split(",")[0].strip()
 
         lower = raw.lower()
-        mapping = {
-            "morning": "MORNING",
-            "afternoon": "AFTERNOON",
-            "evening": "EVENING",
-            "night": "NIGHT",
-            "오전": "MORNING",
-            "아침": "MORNING",
-            "점심": "AFTERNOON",
-            "오후": "AFTERNOON",
-            "저녁": "EVENING",
-            "밤": "NIGHT",
-            "야간": "NIGHT",
-        }
-
-        return mapping.get(lower, raw.upper())
+        return self.TIMESLOT_MAP.get(lower, raw.upper())
 
     def normalize_vibe(self, v: Optional[str]) -> Optional[str]:
         """분위기를 표준 형식으로 정규화"""
@@ -81,34 +126,13 @@ class QueryNormalizer:
 
         raw = str(v).strip().lower()
 
-        mapping = {
-            # 즐거운 계열
-            "신나는": "즐거운",
-            "재밌는": "즐거운",
-            "즐거운": "즐거운",
-
-            # 활기찬 계열
-            "활기찬": "활기찬",
-            "에너지": "활기찬",
-            "에너지넘치는": "활기찬",
-
-            # 여유로운 계열
-            "편안한": "여유로운",
-            "여유로운": "여유로운",
-            "차분한": "여유로운",
-            "조용한": "여유로운",
-
-            # 기타
-            "힐링": "힐링",
-            "감성": "감성적인",
-            "감성적인": "감성적인",
-            "배움": "배움",
-            "진지한": "진지한",
-            "건강한": "건강한",
-        }
+        # 정확히 일치하면 바로 반환 (부분 포함 키끼리 값이 같아 결과 동일)
+        exact = self.VIBE_MAP.get(raw)
+        if exact is not None:
+            return exact
 
         # 부분 포함도 커버
-        for k, vv in mapping.items():
+        for k, vv in self.VIBE_MAP.items():
             if k in raw:
                 return vv
 
@@ -122,15 +146,7 @@ class QueryNormalizer:
         raw = str(lt).strip()
         lower = raw.lower()
 
-        mapping = {
-            "indoor": "INDOOR",
-            "outdoor": "OUTDOOR",
-            "실내": "INDOOR",
-            "실외": "OUTDOOR",
-            "야외": "OUTDOOR",
-        }
-
-        return mapping.get(lower, raw.upper())
+        return self.LOCATION_TYPE_MAP.get(lower, raw.upper())
 
     def normalize_budget_type(self, bt: Optional[str]) -> str:
         """예산 타입을 모델 입력 형식으로 정규화"""
@@ -139,15 +155,8 @@ class QueryNormalizer:
 
         raw = str(bt).strip()
 
-        mapping = {
-            "VALUE": "value", "value": "value",
-            "가성비": "value", "합리": "value",
-            "QUALITY": "quality", "quality": "quality",
-            "품질": "quality",
-        }
-
-        return mapping.get(raw, mapping.get(raw.upper(),
-                                           mapping.get(raw.lower(), "value")))
+        budget = self.BUDGET_TYPE_MAP
+        return budget.get(raw) or budget.get(raw.upper()) or budget.get(raw.lower(), "value")
 
     def normalize_taxonomy(self, q: dict) -> dict:
         """카테고리/서브카테고리를 DB 체계에 맞게 교정"""
@@ -3,10 +3,85 @@ Intent Adjuster
 Intent 기반 점수 보정
 """
 
+from functools import lru_cache
 from typing import Optional
 from app.core.logging import logger
 
 
+# 유사 vibe 계열
+_HEALING_VIBES = frozenset({"힐링", "여유로운", "차분한", "조용한", "편안한", "잔잔한"})
+_FUN_VIBES = frozenset({"즐거운", "신나는", "재밌는", "활기찬", "흥미로운", "재미있는"})
+
+# intent별 subcategory 그룹
+_QUIET_NOISY_SUBS = frozenset({"볼링", "당구", "방탈출", "노래방", "클럽", "술집", "와인바", "탁구"})
+_QUIET_CALM_SOCIAL_SUBS = frozenset({"보드게임", "책", "독서"})
+_ACTIVE_SPORT_SUBS = frozenset({"러닝", "클라이밍", "배드민턴"})
+_ACTIVE_SOCIAL_SUBS = frozenset({"볼링", "당구", "탁구"})
+_HANDS_ON_PENALTY_SUBS = frozenset({"당구", "볼링", "기타", "노래방", "보드게임"})
+_BRAIN_BONUS_SUBS = frozenset({"보드게임", "방탈출"})
+_BRAIN_PENALTY_SUBS = frozenset({"당구", "볼링", "와인바", "노래방"})
+
+
+@lru_cache(maxsize=1024)
+def _intent_category_delta(intent: str, cat: str, sub: str) -> float:
+    """intent × (category, subcategory) 보정 점수 (조합 수가 적어 캐시로 lookup 테이블화)"""
+    delta = 0.0
+
+    # ✅ QUIET intent (힐링/여유/조용)
+    if intent == "QUIET":
+        # 시끄러운 subcategory / 스포츠 → 강력 패널티
+        if sub in _QUIET_NOISY_SUBS:
+            delta -= 45.0
+        if cat == "스포츠":
+            delta -= 45.0
+
+        # 힐링과 잘 맞는 카테고리 보너스
+        if cat == "카페":
+            delta += 22.0
+        elif cat == "문화예술":
+            delta += 18.0
+        elif cat == "소셜" and sub in _QUIET_CALM_SOCIAL_SUBS:
+            delta += 12.0  # 조용한 소셜
+
+    # ACTIVE intent
+    elif intent == "ACTIVE":
+        if cat == "스포츠":
+            if sub == "축구":
+                delta += 18.0
+            elif sub in _ACTIVE_SPORT_SUBS:
+                delta += 10.0
+            else:
+                delta += 8.0
+        else:
+            delta -= 6.0
+
+        # 카페/문화예술 패널티
+        if cat in ("카페", "문화예술"):
+            delta -= 6.0
+
+        # 소셜도 약간 패널티
+        if cat == "소셜":
+            delta += 3.0 if sub in _ACTIVE_SOCIAL_SUBS else -6.0
+
+    # HANDS_ON intent
+    elif intent == "HANDS_ON":
+        if cat == "취미활동":
+            delta += 12.0
+        if cat == "문화예술":
+            delta += 6.0
+        if cat == "소셜" and sub in _HANDS_ON_PENALTY_SUBS:
+            delta -= 18.0
+
+    # BRAIN intent (카페/문화예술은 중립)
+    elif intent == "BRAIN":
+        if cat == "소셜" and sub in _BRAIN_BONUS_SUBS:
+            delta += 22.0
+        if cat == "소셜" and sub in _BRAIN_PENALTY_SUBS:
+            delta -= 18.0
+
+    return delta
+
+
 class IntentAdjuster:
     """Intent 기반 점수 보정"""
 
@@ -51,15 +126,12 @@ class IntentAdjuster:
                     logger.info(f"[VIBE_MATCH] 완전일치 {requested_vibe} → +18점")
                 else:
                     # 유사 vibe 체크
-                    healing_vibes = {"힐링", "여유로운", "차분한", "조용한", "편안한", "잔잔한"}
-                    fun_vibes = {"즐거운", "신나는", "재밌는", "활기찬", "흥미로운", "재미있는"}
-
                     is_similar = False
-                    if requested_vibe in healing_vibes and meeting_vibe in healing_vibes:
+                    if requested_vibe in _HEALING_VIBES and meeting_vibe in _HEALING_VIBES:
                         is_similar = True
                         adjustment += 10.0
                         logger.info(f"[VIBE_SIMILAR] 힐링계열 유사 → +10점")
-                    elif requested_vibe in fun_vibes and meeting_vibe in fun_vibes:
+                    elif requested_vibe in _FUN_VIBES and meeting_vibe in _FUN_VIBES:
                         is_similar = True
                         adjustment += 10.0
                         logger.info(f"[VIBE_SIMILAR] 즐거운계열 유사 → +10점")
@@ -82,70 +154,11 @@ class IntentAdjuster:
 
             return adjustment
 
-        # ✅ QUIET intent (힐링/여유/조용)
-        if intent == "QUIET":
-            # 시끄러운 subcategory → 매우 큰 패널티
-            noisy_subs = ["볼링", "당구", "방탈출", "노래방", "클럽", "술집", "와인바", "탁구"]
-            if sub in noisy_subs:
-                adjustment -= 45.0  # ✅ 강력 패널티
-                logger.info(f"[QUIET_MISMATCH] {sub} → -45점")
-
-            # 스포츠도 강력 패널티
-            if cat == "스포츠":
-                adjustment -= 45.0
-                logger.info(f"[QUIET_MISMATCH] 스포츠 → -45점")
-
-            # 힐링과 잘 맞는 카테고리 보너스
-            if cat == "카페":
-                adjustment += 22.0
-            elif cat == "문화예술":
-                adjustment += 18.0
-            elif cat == "소셜" and sub in ["보드게임", "책", "독서"]:
-                adjustment += 12.0  # 조용한 소셜
-
-        # ACTIVE intent
-        if intent == "ACTIVE":
-            if cat == "스포츠":
-                if sub == "축구":
-                    adjustment += 18.0
-                elif sub in ["러닝", "클라이밍", "배드민턴"]:
-                    adjustment += 10.0
-                else:
-                    adjustment += 8.0
-            else:
-                adjustment -= 6.0
-
-            # 카페/문화예술 패널티
-            if cat in ["카페", "문화예술"]:
-                adjustment -= 6.0
-
-            # 소셜도 약간 패널티
-            if cat == "소셜":
-                if sub in ["볼링", "당구", "탁구"]:
-                    adjustment += 3.0
-                else:
-                    adjustment -= 6.0
-
-        # HANDS_ON intent
-        if intent == "HANDS_ON":
-            if cat == "취미활동":
-                adjustment += 12.0
-            if cat == "문화예술":
-                adjustment += 6.0
-            if cat == "소셜" and sub in ["당구", "볼링", "기타", "노래방", "보드게임"]:
-                adjustment -= 18.0
-
-        # BRAIN intent
-        if intent == "BRAIN":
-            # 보드게임/방탈출 최우선
-            if cat == "소셜" and sub in ["보드게임", "방탈출"]:
-                adjustment += 22.0
-            # 당구/볼링/와인바 하향
-            if cat == "소셜" and sub in ["당구", "볼링", "와인바", "노래방"]:
-                adjustment -= 18.0
-            # 카페/문화예술은 중립
-            if cat in ["카페", "문화예술"]:
-                adjustment += 0.0
+        # intent × (category, subcategory) 보정 (조합별 1회 계산 후 lookup)
+        intent_delta = _intent_category_delta(intent, cat, sub)
+        if intent == "QUIET" and intent_delta < 0:
+            logger.info(f"[QUIET_MISMATCH] {cat}/{sub} → {intent_delta:+.0f}점")
+        adjustment += intent_delta
 
         # 공놀이 키워드 특별 처리
         if parsed_query:
@@ -5,13 +5,52 @@ LightGBM 기반 점수 계산 + 보정
 
 import math
 from typing import List, Dict, Optional
-import numpy as np
 
 from app.core.logging import logger
-from app.core.scoring_utils import match_from_percentile
+from app.core.scoring_utils import match_from_percentile, percentile_midrank_batch
 from app.core.keyword_utils import clean_keywords
 
 
+# user_context 필드: (정규화 키, 후보 키들, 기본값)
+_USER_CTX_FIELDS = (
+    ("lat", ("lat", "latitude"), None),
+    ("lng", ("lng", "longitude"), None),
+    ("interests", ("interests",), ""),
+    ("time_preference", ("time_preference", "timePreference"), None),
+    ("user_location_pref", ("user_location_pref", "userLocationPref"), None),
+    ("budget_type", ("budget_type", "budgetType"), "value"),
+    ("user_avg_rating", ("user_avg_rating", "userAvgRating"), 3.0),
+    ("user_meeting_count", ("user_meeting_count", "userMeetingCount"), 0),
+    ("user_rating_std", ("user_rating_std", "userRatingStd"), 0.5),
+)
+
+# meeting 필드: (정규화 키, 후보 키들, 기본값)
+_MEETING_FIELDS = (
+    ("meeting_id", ("meeting_id", "meetingId"), None),
+    ("lat", ("latitude", "lat"), None),
+    ("lng", ("longitude", "lng"), None),
+    ("meeting_participant_count", ("current_participants", "currentParticipants"), 0),
+    ("expected_cost", ("expected_cost", "expectedCost"), 0),
+    ("meeting_avg_rating", ("avg_rating", "avgRating"), 0.0),
+    ("meeting_rating_count", ("rating_count", "ratingCount"), 0),
+    ("distance_km", ("distance_km", "distanceKm"), None),
+    ("image_url", ("image_url", "imageUrl"), None),
+    ("location_name", ("location_name", "locationName"), None),
+    ("location_address", ("location_address", "locationAddress"), None),
+    ("meeting_time", ("meeting_time", "meetingTime"), None),
+    ("max_participants", ("max_participants", "maxParticipants"), 10),
+    ("current_participants", ("current_participants", "currentParticipants"), 0),
+)
+
+# 스포츠 모임 title 키워드 → subcategory 교정 (앞에서부터 우선)
+_SPORT_SUB_BY_TITLE = (
+    (("러닝", "달리기"), "러닝"),
+    (("축구", "풋살"), "축구"),
+    (("배드민턴",), "배드민턴"),
+    (("클라이밍",), "클라이밍"),
+)
+
+
 class MeetingScorer:
     """AI 점수 계산 + 보정"""
 
@@ -63,24 +102,21 @@ class MeetingScorer:
         # 1. User 정보 정규화
         user = self._build_user_dict(user_context, parsed_query)
 
-        # 2. Feature 빌드
-        rows, feats, valid_candidates = [], [], []
-        for raw in candidate_meetings:
-            try:
-                m = self._normalize_meeting(raw)
-                feat, x = self.model_loader.feature_builder.build(user, m)
-                rows.append(x[0])
-                feats.append(feat)
-                valid_candidates.append(m)
-            except Exception as e:
-                logger.warning(f"⚠️ feature build 실패 meeting_id={raw.get('meeting_id')}: {e}")
-                continue
+        # 2. Feature 빌드 (정규화 후 한 번에 (N, F) 행렬 생성)
+        normalized = self._normalize_meetings(candidate_meetings)
+
+        feats, X, kept = self.model_loader.feature_builder.build_batch(user, normalized, skip_errors=True)
+        valid_candidates = [normalized[i] for i in kept]
 
-        if not rows:
+        if len(valid_candidates) < len(normalized):
+            kept_set = set(kept)
+            failed_ids = [m.get("meeting_id") for i, m in enumerate(normalized) if i not in kept_set]
+            logger.warning(f"⚠️ feature build 실패 meeting_ids={failed_ids}")
+
+        if not valid_candidates:
             return []
 
         # 3. LightGBM 예측
-        X = np.vstack(rows)
         rank_raw = self.model_loader.ranker.predict(X)
         raw_list = [float(v) for v in rank_raw]
         n = len(raw_list)
@@ -168,74 +204,86 @@ class MeetingScorer:
 
     def _build_user_dict(self, user_ctx: dict, parsed_query: dict) -> dict:
         """User 정보 딕셔너리 생성"""
+        ctx = self._normalize_user_context(user_ctx)
 
-        def pick(d: dict, *keys, default=None):
-            for k in keys:
-                if k in d and d.get(k) is not None:
-                    return d.get(k)
-            return default
-
-        user_time_pref = (
-                parsed_query.get("user_time_preference")
-                or pick(user_ctx, "time_preference", "timePreference", default=None)
-        )
+        user_time_pref = parsed_query.get("user_time_preference") or ctx["time_preference"]
 
         return {
-            "lat": pick(user_ctx, "lat", "latitude", default=None),
-            "lng": pick(user_ctx, "lng", "longitude", default=None),
-            "interests": pick(user_ctx, "interests", default=""),
+            "lat": ctx["lat"],
+            "lng": ctx["lng"],
+            "interests": ctx["interests"],
             "time_preference": self.normalizer.normalize_timeslot(user_time_pref),
-            "user_location_pref": pick(user_ctx, "user_location_pref", "userLocationPref", default=None),
-            "budget_type": self.normalizer.normalize_budget_type(
-                pick(user_ctx, "budget_type", "budgetType", default="value")
-            ),
-            "user_avg_rating": float(pick(user_ctx, "user_avg_rating", "userAvgRating", default=3.0)),
-            "user_meeting_count": int(pick(user_ctx, "user_meeting_count", "userMeetingCount", default=0)),
-            "user_rating_std": float(pick(user_ctx, "user_rating_std", "userRatingStd", default=0.5)),
+            "user_location_pref": ctx["user_location_pref"],
+            "budget_type": self.normalizer.normalize_budget_type(ctx["budget_type"]),
+            "user_avg_rating": float(ctx["user_avg_rating"]),
+            "user_meeting_count": int(ctx["user_meeting_count"]),
+            "user_rating_std": float(ctx["user_rating_std"]),
         }
 
-    def _normalize_meeting(self, m: dict) -> dict:
-        """모임 정보 정규화"""
-        title = (m.get("title") or "").strip()
-        sub = (m.get("subcategory") or "").strip()
-        cat = (m.get("category") or "").strip()
-
-        # title 기반 스포츠 subcategory 자동 교정
-        if cat == "스포츠" and title:
-            t = title.lower()
-            if "러닝" in t or "달리기" in t:
-                sub = "러닝"
-            elif "축구" in t or "풋살" in t:
-                sub = "축구"
-            elif "배드민턴" in t:
-                sub = "배드민턴"
-            elif "클라이밍" in t:
-                sub = "클라이밍"
+    @staticmethod
+    def _normalize_user_context(user_ctx: dict) -> dict:
+        """snake/camel 키 변형을 한 번에 정리한 flat dict (None이 아닌 첫 값, 없으면 default)"""
+        ctx = {}
+        for name, keys, default in _USER_CTX_FIELDS:
+            value = default
+            for k in keys:
+                v = user_ctx.get(k)
+                if v is not None:
+                    value = v
+                    break
+            ctx[name] = value
+        return ctx
+
+    def _normalize_meetings(self, meetings: List[dict]) -> List[dict]:
+        """
+        모임 정보 일괄 정규화
+        - snake/camel 키 변형은 _MEETING_FIELDS 테이블로 한 번에 병합
+        - 정규화 함수는 루프 밖에서 바인딩
+        - 정규화 실패한 모임은 로그 후 제외
+        """
+        normalize_timeslot = self.normalizer.normalize_timeslot
+        normalize_location_type = self.normalizer.normalize_location_type
 
-        return {
-            "meeting_id": m.get("meeting_id") or m.get("meetingId"),
-            "lat": m.get("latitude") or m.get("lat"),
-            "lng": m.get("longitude") or m.get("lng"),
-            "category": cat or "",
-            "subcategory": sub or "",
-            "time_slot": self.normalizer.normalize_timeslot(m.get("time_slot") or m.get("timeSlot")),
-            "meeting_location_type": self.normalizer.normalize_location_type(
-                m.get("location_type") or m.get("locationType")
-            ),
-            "vibe": m.get("vibe", "") or "",
-            "meeting_participant_count": m.get("current_participants") or m.get("currentParticipants") or 0,
-            "expected_cost": m.get("expected_cost") or m.get("expectedCost") or 0,
-            "meeting_avg_rating": m.get("avg_rating") or m.get("avgRating") or 0.0,
-            "meeting_rating_count": m.get("rating_count") or m.get("ratingCount") or 0,
-            "distance_km": m.get("distance_km") or m.get("distanceKm"),
-            "title": m.get("title"),
-            "image_url": m.get("image_url") or m.get("imageUrl"),
-            "location_name": m.get("location_name") or m.get("locationName"),
-            "location_address": m.get("location_address") or m.get("locationAddress"),
-            "meeting_time": m.get("meeting_time") or m.get("meetingTime"),
-            "max_participants": m.get("max_participants") or m.get("maxParticipants") or 10,
-            "current_participants": m.get("current_participants") or m.get("currentParticipants") or 0,
-        }
+        normalized = []
+        for m in meetings:
+            try:
+                title = (m.get("title") or "").strip()
+                cat = (m.get("category") or "").strip()
+                sub = (m.get("subcategory") or "").strip()
+
+                # title 기반 스포츠 subcategory 자동 교정
+                if cat == "스포츠" and title:
+                    t = title.lower()
+                    for words, fixed_sub in _SPORT_SUB_BY_TITLE:
+                        if any(w in t for w in words):
+                            sub = fixed_sub
+                            break
+
+                row = {
+                    "category": cat,
+                    "subcategory": sub,
+                    "time_slot": normalize_timeslot(m.get("time_slot") or m.get("timeSlot")),
+                    "meeting_location_type": normalize_location_type(
+                        m.get("location_type") or m.get("locationType")
+                    ),
+                    "vibe": m.get("vibe", "") or "",
+                    "title": m.get("title"),
+                }
+
+                # `a or b (or default)` 체인과 동일: 앞에서부터 truthy 값, 없으면 default(없으면 마지막 값)
+                for name, keys, default in _MEETING_FIELDS:
+                    v = None
+                    for k in keys:
+                        v = m.get(k)
+                        if v:
+                            break
+                    row[name] = v if (v or default is None) else default
+
+                normalized.append(row)
+            except Exception as e:
+                logger.warning(f"⚠️ meeting 정규화 실패 meeting_id={m.get('meeting_id')}: {e}")
+
+        return normalized
 
     def _dynamic_ceil(self, n: int, conf: float) -> int:
         """동적 상한"""
@@ -294,23 +342,12 @@ class MeetingScorer:
                 match_scores[i] = int(round(ms))
 
         else:
-            sorted_vals = sorted(raw_list)
-
-            def percentile_midrank(x: float) -> float:
-                lt = sum(1 for v in sorted_vals if v < x)
-                eq = sum(1 for v in sorted_vals if v == x)
-                p = (lt + 0.5 * eq) / n
-                eps = 0.5 / n
-                if p < eps:
-                    p = eps
-                if p > 1 - eps:
-                    p = 1 - eps
-                return p
+            percentiles = percentile_midrank_batch(raw_list)
 
             for i, s in enumerate(raw_list):
                 meeting_id = valid_candidates[i].get("meeting_id", i)
 
-                p = percentile_midrank(float(s))
+                p = float(percentiles[i])
 
                 # meeting_id 기반 noise
                 id_noise = (meeting_id % 1000) * 0.00001
@@ -3,11 +3,19 @@ Meeting Search Service
 모임 검색 + Relaxation 로직
 """
 
+import asyncio
 import httpx
-import json
 from collections import Counter
 from typing import List, Dict, Optional
 from app.core.logging import logger
+from app.core import json_utils
+from app.core.keyword_utils import compile_keyword_pattern
+
+# 명시적 조용함 표현 (모듈 로드 시 1회 컴파일)
+_EXPLICIT_QUIET_RE = compile_keyword_pattern(["조용", "차분", "힐링", "잔잔", "고요"])
+
+# L0 miss 시 동시에 요청할 완화 단계 수 (이후 단계는 순차)
+_RELAX_PARALLEL_LAYERS = 2
 
 
 class MeetingSearchService:
@@ -18,12 +26,14 @@ class MeetingSearchService:
             spring_boot_url: str,
             query_builder,
             search_strategy,
-            normalizer
+            normalizer,
+            http_client: Optional[httpx.AsyncClient] = None
     ):
         self.spring_boot_url = spring_boot_url
         self.query_builder = query_builder
         self.search_strategy = search_strategy
         self.normalizer = normalizer
+        self.http_client = http_client or httpx.AsyncClient(timeout=10.0)
 
     async def search_with_relaxation(
             self,
@@ -83,28 +93,57 @@ class MeetingSearchService:
         # Relaxation plan 생성
         plans = self.search_strategy.get_relaxation_plan(base_query, user_prompt)
 
-        # 순차 완화
+        # 완화 단계별 쿼리를 미리 누적 생성 (각 단계는 이전 단계 결과에 키를 추가 제거)
+        layers = []
         current = dict(q0)
-        level = 1
-        for label, keys in plans:
-            qn = self._drop_keys(current, *keys)
-            cands = await self._try_search(label, qn, level, user_context, trace_steps, user_prompt)
-
+        for level, (label, keys) in enumerate(plans, start=1):
+            current = self._drop_keys(current, *keys)
+            layers.append((label, current, level))
+
+        # 앞쪽 _RELAX_PARALLEL_LAYERS 단계만 동시에 요청 (trace는 단계별로 모아서 순서대로 병합)
+        # 나머지는 순차 요청 → L0 miss마다 Spring 검색이 단계 수만큼 폭증하지 않도록 제한
+        head = layers[:_RELAX_PARALLEL_LAYERS]
+        head_traces = [[] for _ in head]
+        head_results = await asyncio.gather(*[
+            self._try_search(label, qn, level, user_context, head_traces[i], user_prompt)
+            for i, (label, qn, level) in enumerate(head)
+        ])
+
+        # 가장 낮은 단계의 non-empty 결과 채택 (순차 완화와 동일한 의미)
+        for (label, qn, level), cands, steps in zip(head, head_results, head_traces):
+            trace_steps.extend(steps)
             if cands:
-                if base_cat and all((m.get("category") or "").strip() != base_cat for m in cands):
-                    q_fix = self._drop_keys(qn, "location_query", "locationQuery")
-                    c2 = await self._try_search(f"{label}-guard", q_fix, level + 1, user_context, trace_steps,
-                                                user_prompt)
-                    if c2:
-                        return c2
-                return cands
+                return await self._accept_relaxed(label, qn, level, cands, base_cat, user_context, trace_steps,
+                                                  user_prompt)
 
-            current = qn
-            level += 1
+        for label, qn, level in layers[_RELAX_PARALLEL_LAYERS:]:
+            cands = await self._try_search(label, qn, level, user_context, trace_steps, user_prompt)
+            if cands:
+                return await self._accept_relaxed(label, qn, level, cands, base_cat, user_context, trace_steps,
+                                                  user_prompt)
 
         logger.warning("🔥 [RELAX_END] 모든 단계 실패 - 빈 리스트 반환")
         return []
 
+    async def _accept_relaxed(
+            self,
+            label: str,
+            qn: dict,
+            level: int,
+            cands: List[dict],
+            base_cat: Optional[str],
+            user_context: dict,
+            trace_steps: list,
+            user_prompt: str
+    ) -> List[dict]:
+        """완화 단계 결과 채택 (category가 전부 어긋나면 locationQuery 제거 재시도)"""
+        if base_cat and all((m.get("category") or "").strip() != base_cat for m in cands):
+            q_fix = self._drop_keys(qn, "location_query", "locationQuery")
+            c2 = await self._try_search(f"{label}-guard", q_fix, level + 1, user_context, trace_steps, user_prompt)
+            if c2:
+                return c2
+        return cands
+
     async def _try_search(
             self,
             label: str,
@@ -118,7 +157,9 @@ class MeetingSearchService:
         logger.info(f"🔥 [RELAX_{level}] {label} 시작")
         logger.info(f"🔥 [RELAX_{level}] query={q}")
 
-        meetings = await self._search_meetings(q, user_context, user_prompt)
+        # payload는 한 번만 생성해서 요청/trace에 공유
+        payload = self.query_builder.build_search_request(q, user_context, user_prompt)
+        meetings = await self._search_meetings(payload)
         meetings = meetings or []
 
         # ✅ VIBE 2차 필터링 (Spring이 안 했으니 여기서 처리)
@@ -186,37 +227,32 @@ class MeetingSearchService:
         trace_steps.append({
             "level": level,
             "label": label,
-            "payload": self.query_builder.build_search_request(q, user_context, user_prompt),
+            "payload": payload,
             "count": len(meetings),
             "cats": dict(Counter((m.get("category"), m.get("subcategory")) for m in meetings)) if meetings else {},
         })
 
         return meetings
 
-    async def _search_meetings(
-            self,
-            enriched_query: dict,
-            user_context: dict,
-            user_prompt: str = ""
-    ) -> List[dict]:
+    async def _search_meetings(self, payload: dict) -> List[dict]:
         """Spring Boot API 호출"""
         try:
-            payload = self.query_builder.build_search_request(enriched_query, user_context, user_prompt)
-            logger.info(f"[PAYLOAD_FULL] {payload}")
+            # 한 번 직렬화한 body를 로그와 요청에 같이 사용 (dict → json 중복 변환 제거)
+            body = json_utils.dumps(payload)
 
             logger.info(f"[SEARCH_REQUEST] URL={self.spring_boot_url}/api/meetings/search")
-            logger.info(f"[SEARCH_PAYLOAD] {json.dumps(payload, ensure_ascii=False)}")
+            logger.info(f"[SEARCH_PAYLOAD] {body.decode('utf-8')}")
 
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.post(
-                    f"{self.spring_boot_url}/api/meetings/search",
-                    json=payload
-                )
+            response = await self.http_client.post(
+                f"{self.spring_boot_url}/api/meetings/search",
+                content=body,
+                headers=json_utils.JSON_HEADERS
+            )
 
             logger.info(f"[SEARCH_RESPONSE] status={response.status_code}")
 
             if response.status_code == 200:
-                result = response.json()
+                result = json_utils.loads(response.content)
                 meetings = result.get("meetings", [])
 
                 logger.info(f"📦 Spring 응답: {len(meetings)}개 모임 받음")
@@ -245,5 +281,4 @@ class MeetingSearchService:
 
     def _has_explicit_quiet(self, text: str) -> bool:
         """명시적 조용함 표현 감지"""
-        t = (text or "").lower()
-        return any(w in t for w in ["조용", "차분", "힐링", "잔잔", "고요"])
\ No newline at end of file
+        return bool(_EXPLICIT_QUIET_RE.search((text or "").lower()))
\ No newline at end of file
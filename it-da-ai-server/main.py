@@ -29,13 +29,17 @@ print("🔧 FastAPI 서버 시작...")
 print(f"📍 OPENAI_API_KEY: {'설정됨' if os.getenv('OPENAI_API_KEY') else '❌ 없음'}")
 print(f"📍 SPRING_BOOT_URL: {os.getenv('SPRING_BOOT_URL', 'http://localhost:8080')}")
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
-from app.api.ai_routes import router as ai_router
+from app.api.ai_routes import router as ai_router, close_ai_services
 from app.api.recommendations import router as recommendations_router
 from app.models.model_loader import model_loader
+from app.core.config import settings
 from app.core.logging import logger
+# ✅ orjson이 설치되어 있으면 응답 직렬화에 사용 (stdlib json 대비 2~5배 빠름)
+from app.core.responses import FastJSONResponse
 
 # ========================================
 # Lifespan Event Handler
@@ -55,6 +59,7 @@ async def lifespan(app: FastAPI):
 
     yield
 
+    await close_ai_services()
     logger.info("👋 ITDA AI Server 종료")
 
 
@@ -62,23 +67,32 @@ app = FastAPI(
     title="ITDA AI Server",
     description="모임 추천 AI 서버 (SVD, LightGBM Ranker, KcELECTRA)",
     version="2.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse
 )
 
+# ========================================
+# 전역 예외 핸들러
+# ========================================
+
+# ⚠️ exception_handler(Exception)는 CORS 바깥(ServerErrorMiddleware)에서 실행되어 500 응답에 CORS 헤더가 빠짐
+#    → 미들웨어로 등록하고 CORSMiddleware보다 먼저 추가해서 CORS 안쪽에서 처리
+@app.middleware("http")
+async def unhandled_exception_middleware(request: Request, call_next):
+    """라우트별 try/except → 500 변환을 대체 (HTTPException은 FastAPI 기본 처리)"""
+    try:
+        return await call_next(request)
+    except Exception as exc:
+        logger.exception(f"❌ 처리되지 않은 예외: {request.method} {request.url.path} - {exc}")
+        return JSONResponse(status_code=500, content={"detail": str(exc)})
+
 # ========================================
 # CORS 설정
 # ========================================
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=[
-        "http://localhost:3000",
-        "http://localhost:5173",
-        "http://localhost:8080",
-        "http://127.0.0.1:3000",
-        "http://127.0.0.1:5173",
-        "http://127.0.0.1:8080",
-    ],
+    allow_origins=settings.get_allowed_origins,  # .env ALLOWED_ORIGINS (기본값은 로컬 개발 출처)
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
@@ -52,10 +52,12 @@ const notificationApi = {
     },
 
     /**
-     * 알림 삭제
+     * 알림 삭제 (본인 알림만 삭제됨)
      */
-    deleteNotification: async (notificationId: number): Promise<void> => {
-        await apiClient.delete(`/api/notifications/${notificationId}`);
+    deleteNotification: async (notificationId: number, userId: number): Promise<void> => {
+        await apiClient.delete(`/api/notifications/${notificationId}`, {
+            params: { userId },
+        });
     },
 
     /**
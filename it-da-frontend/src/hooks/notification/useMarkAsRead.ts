@@ -72,11 +72,13 @@ export function useMarkAsRead(): UseMarkAsReadReturn {
 
     // 알림 삭제
     const deleteNotification = useCallback(async (notificationId: number): Promise<boolean> => {
+        if (!user?.userId) return false;
+
         setLoading(true);
         setError(null);
 
         try {
-            await notificationApi.deleteNotification(notificationId);
+            await notificationApi.deleteNotification(notificationId, user.userId);
             // 스토어에서도 삭제
             const notification = store.notifications.find(n => n.notificationId === notificationId);
             if (notification) {
@@ -91,7 +93,7 @@ export function useMarkAsRead(): UseMarkAsReadReturn {
         } finally {
             setLoading(false);
         }
-    }, [store]);
+    }, [user?.userId, store]);
 
     // 모든 알림 삭제
     const deleteAllNotifications = useCallback(async (): Promise<boolean> => {
@@ -12,6 +12,7 @@ const API_BASE_URL = "http://localhost:8080";
 export const useNotificationWebSocket = () => {
     const user = useAuthStore((state) => state.user);
     const addNotification = useNotificationStore((state) => state.addNotificationFromBackend);
+    const setUnreadCount = useNotificationStore((state) => state.setUnreadCount);
     const clientRef = useRef<Client | null>(null);
 
     useEffect(() => {
@@ -26,7 +27,15 @@ export const useNotificationWebSocket = () => {
                 client.subscribe(`/topic/notification/${user.userId}`, (message: IMessage) => {
                     if (message.body) {
                         try {
-                            const newNotification = JSON.parse(message.body);
+                            const payload = JSON.parse(message.body);
+
+                            // ✅ 안읽은 개수 푸시 (폴링 대체) - 토스트 없이 배지만 갱신
+                            if (payload.type === 'UNREAD_COUNT_UPDATE') {
+                                setUnreadCount(payload.unreadCount ?? 0);
+                                return;
+                            }
+
+                            const newNotification = payload.notification ?? payload;
                             console.log("📨 실시간 알림 수신:", newNotification);
 
                             addNotification(newNotification);
@@ -103,5 +112,5 @@ export const useNotificationWebSocket = () => {
         return () => {
             if (client.connected) client.deactivate();
         };
-    }, [user?.userId, addNotification]);
+    }, [user?.userId, addNotification, setUnreadCount]);
 };
\ No newline at end of file
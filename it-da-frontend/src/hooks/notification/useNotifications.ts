@@ -8,7 +8,7 @@ import notificationApi from '@/api/notification.api';
 interface UseNotificationsOptions {
     /** 자동으로 조회할지 여부 (기본값: true) */
     autoFetch?: boolean;
-    /** 폴링 간격 (ms, 0이면 비활성화, 기본값: 30000 = 30초) */
+    /** 폴링 간격 (ms, 0이면 비활성화, 기본값: 0 - 개수는 웹소켓 UNREAD_COUNT_UPDATE로 수신) */
     pollingInterval?: number;
 }
 
@@ -24,7 +24,7 @@ interface UseNotificationsReturn {
 }
 
 export function useNotifications(options: UseNotificationsOptions = {}): UseNotificationsReturn {
-    const { autoFetch = true, pollingInterval = 30000 } = options;
+    const { autoFetch = true, pollingInterval = 0 } = options;
     const { user } = useAuthStore();
     const { fetchNotifications } = useNotificationStore();
 
@@ -82,6 +82,7 @@ interface NotificationState {
     content: string;
   }) => void;
   addNotificationFromBackend: (notification: NotificationResponseDTO) => void; // ✅ 추가
+  setUnreadCount: (count: number) => void; // ✅ 웹소켓 UNREAD_COUNT_UPDATE 반영
   markAsRead: (id: string) => void;
   markAllAsRead: () => void;
   removeNotification: (id: string) => void;
@@ -360,10 +361,14 @@ export const useNotificationStore = create<NotificationState>((set, get) => ({
   removeNotification: (id) => {
     const notification = get().notifications.find((n) => n.id === id);
 
-    // 백엔드 알림이면 API 호출
-    if (notification?.notificationId) {
+    // 백엔드 알림이면 API 호출 (userId는 localStorage에서)
+    const userStr = localStorage.getItem("user");
+    const userId: number | undefined = userStr
+      ? JSON.parse(userStr)?.userId
+      : undefined;
+    if (notification?.notificationId && userId) {
       notificationApi
-        .deleteNotification(notification.notificationId)
+        .deleteNotification(notification.notificationId, userId)
         .catch((err) => {
           console.error("❌ 알림 삭제 API 실패:", err);
         });
@@ -382,6 +387,18 @@ export const useNotificationStore = create<NotificationState>((set, get) => ({
     });
   },
 
+  // ✅ 추가: 서버 푸시 기준 안읽은 개수 동기화
+  // (백엔드 개수 + 아직 서버에 없는 실시간 알림 개수)
+  setUnreadCount: (count: number) => {
+    set((state) => ({
+      unreadCount:
+        count +
+        state.notifications.filter(
+          (n) => !n.id.startsWith("backend-") && n.isUnread,
+        ).length,
+    }));
+  },
+
   // ✅ 기존 코드 100% 유지
   clearAll: () => {
     set({ notifications: [], unreadCount: 0 });